@@ -135,10 +135,10 @@ def test_data_dir():
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def temp_config_file(tmp_path):
-    """Create a temporary configuration file for testing."""
-    config_file = tmp_path / "test_config.json"
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary configuration file shared by the test session."""
+    config_file = tmp_path_factory.mktemp("cfg") / "test_config.json"
     config_content = """
     [
         {
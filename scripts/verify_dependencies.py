@@ -82,6 +82,7 @@ def get_core_dependencies() -> List[Tuple[str, str]]:
         ("aiohttp", "aiohttp"),
         ("GitPython", "git"),
         ("pydantic", "pydantic"),
+        ("orjson", "orjson"),
         ("PyYAML", "yaml"),
         ("structlog", "structlog"),
         ("tenacity", "tenacity"),
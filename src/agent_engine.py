@@ -30,6 +30,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import git
+import orjson
 import requests
 from anthropic import Anthropic
 from dotenv import load_dotenv
@@ -44,6 +45,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# "### File: <path>" header followed by a fenced code block, with optional
+# leading whitespace and an optional language after the opening fence
+_CODE_BLOCK_RE = re.compile(
+    r'\s*### File: ([^\n]+)\n\s*```(?:\w+)?\n(.*?)\n\s*```',
+    re.DOTALL | re.MULTILINE
+)
+
 
 class GitManager:
     """Handles Git operations for the agent engine."""
@@ -132,12 +140,11 @@ class GitManager:
             File content as string, or None if file doesn't exist
         """
         try:
-            full_path = self.repo_path / file_path
-            if full_path.exists():
-                return full_path.read_text(encoding='utf-8')
-            else:
-                logger.warning(f"File not found: {file_path}")
-                return None
+            # Open directly rather than stat-ing first: one syscall fewer and no race
+            return (self.repo_path / file_path).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file_path}")
+            return None
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
             return None
@@ -318,12 +325,7 @@ Format your response as:
         """Extract code blocks with file paths from Claude's response."""
         code_blocks = {}
         
-        # Pattern to match file headers and code blocks with optional leading whitespace
-        # Handle cases with or without language specification
-        pattern = r'\s*### File: ([^\n]+)\n\s*```(?:\w+)?\n(.*?)\n\s*```'
-        matches = re.findall(pattern, response, re.DOTALL | re.MULTILINE)
-        
-        for file_path, code_content in matches:
+        for file_path, code_content in _CODE_BLOCK_RE.findall(response):
             # Clean up file path
             file_path = file_path.strip()
             # Clean up code content
@@ -379,6 +381,20 @@ class TestExecutor:
             return False, f"Failed to run tests: {str(e)}"
 
 
+# Sent verbatim on every call; the issue and body travel as GraphQL variables
+_COMMENT_CREATE_MUTATION = """
+mutation CommentCreate($issueId: String!, $body: String!) {
+    commentCreate(input: {issueId: $issueId, body: $body}) {
+        success
+        comment {
+            id
+            body
+        }
+    }
+}
+"""
+
+
 class LinearAPIClient:
     """Handles communication with the Linear API for reporting."""
     
@@ -392,6 +408,9 @@ class LinearAPIClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # Keeps the HTTPS connection to Linear open between calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def add_comment(self, issue_id: str, comment_body: str) -> bool:
         """
@@ -405,37 +424,25 @@ class LinearAPIClient:
             True if successful, False otherwise
         """
         try:
-            mutation = """
-            mutation CommentCreate($issueId: String!, $body: String!) {
-                commentCreate(input: {issueId: $issueId, body: $body}) {
-                    success
-                    comment {
-                        id
-                        body
-                    }
-                }
-            }
-            """
-            
             variables = {
                 "issueId": issue_id,
                 "body": comment_body
             }
             
             payload = {
-                "query": mutation,
+                "query": _COMMENT_CREATE_MUTATION,
                 "variables": variables
             }
             
-            response = requests.post(
+            # The session already sends Content-Type: application/json
+            response = self.session.post(
                 self.api_url,
-                json=payload,
-                headers=self.headers,
+                data=orjson.dumps(payload),
                 timeout=30
             )
             
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if result.get("data", {}).get("commentCreate", {}).get("success"):
                 logger.info(f"Successfully added comment to issue {issue_id}")
@@ -670,7 +677,9 @@ The agent workflow encountered an error and could not complete the task. Please
     
     def _slack_callback_wrapper(self, status: str, message: str):
         """Wrapper for Slack callback functionality."""
-        if not self.callback_context:
+        # Nothing can be posted without a thread; skip importing the Slack bot
+        context = self.callback_context
+        if not context or not context.get('channel') or not context.get('thread_ts'):
             return
         
         try:
@@ -6,23 +6,36 @@ Handles direct Slack API operations beyond the bot framework.
 
 import logging
 import os
-from typing import Dict, List, Optional
+import ssl
+import time
+from typing import Dict, List, Optional, Tuple
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 logger = logging.getLogger(__name__)
 
+# Shared by every WebClient in the process. Without an explicit context urllib
+# builds a new one, re-loading the CA bundle (~20 ms), for each HTTPS request.
+SLACK_SSL_CONTEXT = ssl.create_default_context()
+
+USER_INFO_CACHE_TTL = 900  # seconds
+USER_INFO_CACHE_MAXSIZE = 4096
+
 
 class SlackClient:
     """Client for Slack API operations."""
     
-    def __init__(self, token: Optional[str] = None):
-        self.token = token or os.getenv("SLACK_BOT_TOKEN")
+    def __init__(self, token: Optional[str] = None, client: Optional[WebClient] = None):
+        self.token = token or (client.token if client else None) or os.getenv("SLACK_BOT_TOKEN")
         if not self.token:
             raise ValueError("Slack bot token not found in environment variables")
         
-        self.client = WebClient(token=self.token)
+        # Reuse an existing WebClient (e.g. the Bolt app's) when given so the
+        # process keeps a single SSL context and set of retry handlers.
+        self.client = client or WebClient(token=self.token, ssl=SLACK_SSL_CONTEXT)
+        # user ID -> (expiry on the monotonic clock, users.info "user" payload)
+        self._user_info_cache: Dict[str, Tuple[float, Dict]] = {}
     
     def send_message(
         self,
@@ -59,12 +72,40 @@ class SlackClient:
             return response["ok"]
             
         except SlackApiError as e:
-            logger.error(f"Slack API error: {e.response['error']}")
+            logger.error("Slack API error: %s", e.response['error'])
             return False
         except Exception as e:
-            logger.error(f"Failed to send Slack message: {e}")
+            logger.error("Failed to send Slack message: %s", e)
             return False
     
+    def send_status(
+        self,
+        channel: str,
+        text: str,
+        status_emoji: str,
+        thread_ts: Optional[str] = None
+    ) -> bool:
+        """
+        Post a status update as a single message.
+        
+        The status emoji rides along in a context block, so callers don't need
+        a separate reactions.add round trip to mark the message's state.
+        
+        Args:
+            channel: Channel ID
+            text: Message text (also the notification fallback)
+            status_emoji: Emoji shortcode or character shown with the message
+            thread_ts: Thread timestamp for replies
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": text}},
+            {"type": "context", "elements": [{"type": "mrkdwn", "text": status_emoji}]}
+        ]
+        return self.send_message(channel, text, thread_ts=thread_ts, blocks=blocks)
+    
     def send_file(
         self,
         channel: str,
@@ -105,27 +146,42 @@ class SlackClient:
             return response["ok"]
             
         except SlackApiError as e:
-            logger.error(f"Slack API error: {e.response['error']}")
+            logger.error("Slack API error: %s", e.response['error'])
             return False
         except Exception as e:
-            logger.error(f"Failed to upload file to Slack: {e}")
+            logger.error("Failed to upload file to Slack: %s", e)
             return False
     
     def get_user_info(self, user_id: str) -> Optional[Dict]:
-        """Get information about a Slack user."""
+        """Get information about a Slack user (successful lookups are cached for a TTL)."""
+        now = time.monotonic()
+        cached = self._user_info_cache.get(user_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
         try:
             response = self.client.users_info(user=user_id)
             if response["ok"]:
-                return response["user"]
+                user = response["user"]
+                self._cache_user_info(user_id, user, now)
+                return user
             return None
             
         except SlackApiError as e:
-            logger.error(f"Slack API error: {e.response['error']}")
+            logger.error("Slack API error: %s", e.response['error'])
             return None
         except Exception as e:
-            logger.error(f"Failed to get user info: {e}")
+            logger.error("Failed to get user info: %s", e)
             return None
     
+    def _cache_user_info(self, user_id: str, user: Dict, now: float) -> None:
+        """Store a users.info result, evicting the oldest entry when full."""
+        cache = self._user_info_cache
+        cache.pop(user_id, None)
+        if len(cache) >= USER_INFO_CACHE_MAXSIZE:
+            del cache[next(iter(cache))]
+        cache[user_id] = (now + USER_INFO_CACHE_TTL, user)
+    
     def add_reaction(
         self,
         channel: str,
@@ -144,8 +200,8 @@ class SlackClient:
         except SlackApiError as e:
             # Ignore "already_reacted" errors
             if e.response['error'] != 'already_reacted':
-                logger.error(f"Slack API error: {e.response['error']}")
+                logger.error("Slack API error: %s", e.response['error'])
             return False
         except Exception as e:
-            logger.error(f"Failed to add reaction: {e}")
+            logger.error("Failed to add reaction: %s", e)
             return False
\ No newline at end of file
@@ -6,15 +6,23 @@ This module implements a Slack bot that listens for mentions and triggers
 agent workflows based on Linear issue URLs in messages.
 """
 
+import json
 import logging
 import os
 import re
+import signal
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk import WebClient
 from dotenv import load_dotenv
 
 # Add src to path
@@ -22,7 +30,8 @@ project_root = Path(__file__).parent.parent.parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from infrastructure.external.slack_client import SlackClient
+from agent_engine import AgentDispatcher
+from infrastructure.external.slack_client import SLACK_SSL_CONTEXT, SlackClient
 from shared.utils.issue_parser import LinearIssueParser
 
 # Load environment variables
@@ -35,21 +44,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lazy mention listeners run here after the event has been acked; bounded so a
+# burst of mentions queues instead of spawning unbounded threads
+_MENTION_WORKERS = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("SLACK_WORKERS", "8")),
+    thread_name_prefix="slack-mention"
+)
+
 # Initialize Slack app
 app = App(
-    token=os.environ.get("SLACK_BOT_TOKEN"),
-    signing_secret=os.environ.get("SLACK_SIGNING_SECRET")
+    client=WebClient(token=os.environ.get("SLACK_BOT_TOKEN"), ssl=SLACK_SSL_CONTEXT),
+    signing_secret=os.environ.get("SLACK_SIGNING_SECRET"),
+    listener_executor=_MENTION_WORKERS
 )
 
 # Initialize components
-slack_client = SlackClient()
+slack_client = SlackClient(client=app.client)
 issue_parser = LinearIssueParser()
+agent_dispatcher = AgentDispatcher()
+
+# Shared executor for Slack API I/O so progress updates don't block callers
+_SLACK_IO = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-io")
+
+# Emoji prefixed to progress updates, by status
+_STATUS_EMOJI = MappingProxyType({
+    'started': '🔄',
+    'success': '✅',
+    'failed': '❌',
+    'testing': '🧪',
+    'committing': '💾'
+})
+# Line prefixes built once so each update is a single concatenation
+_STATUS_PREFIX = MappingProxyType({status: emoji + ' ' for status, emoji in _STATUS_EMOJI.items()})
+_DEFAULT_STATUS_PREFIX = '📝 '
+
+# Progress updates waiting to be posted, per (channel, thread_ts): the message
+# lines and the Future of the scheduled post
+_PROGRESS_BATCH_WINDOW = 0.2  # seconds
+_PROGRESS_BATCHES: Dict[Tuple[str, str], Tuple[List[str], Future]] = {}
+_PROGRESS_LOCK = threading.Lock()
+
+# Last successfully parsed config.json, keyed by path and mtime, plus each
+# project's agents indexed by type (keyed by id(project))
+_CONFIG_CACHE: Dict[str, Any] = {"key": None, "data": None, "agents_by_type": {}}
+_CONFIG_LOCK = threading.Lock()
+
+
+# Agent types a mention can be routed to
+_AGENT_TYPES = frozenset({'developer', 'tester', 'architect', 'reviewer'})
+
+# Bot mentions and the agent/filler keywords stripped from task descriptions
+_BOT_MENTION_RE = re.compile(r'<@U\w+>')
+_TASK_KEYWORD_RE = re.compile(
+    r'\b(?:developer|tester|architect|please|implement|test|design)\b',
+    re.IGNORECASE
+)
+
+# Keywords for each agent type, matched as whole words in a single scan; the
+# group name of the first match is the agent type
+_AGENT_TYPE_RE = re.compile(
+    r"\b(?:"
+    r"(?P<developer>developer|dev|implement|code)"
+    r"|(?P<tester>tester|test|qa)"
+    r"|(?P<architect>architect|architecture|design)"
+    r"|(?P<reviewer>reviewer|review|check)"
+    r")\b",
+    re.IGNORECASE
+)
+# Substrings at least one of which occurs in any text _AGENT_TYPE_RE can match
+_AGENT_KEYWORD_STEMS = (
+    "dev", "implement", "code", "test", "qa",
+    "architect", "design", "review", "check",
+)
+
+
+def _ack_mention(ack):
+    """Acknowledge a bot mention immediately; the work runs in a lazy listener."""
+    ack()
 
 
-@app.event("app_mention")
 def handle_mention(event: Dict, say, ack):
     """Handle bot mentions in Slack."""
-    ack()  # Acknowledge the event
+    ack()  # Acknowledge the event (no-op when invoked as a lazy listener)
     
     try:
         text = event.get('text', '')
@@ -59,8 +135,9 @@ def handle_mention(event: Dict, say, ack):
         
         logger.info(f"Bot mentioned by {user} in {channel}: {text}")
         
-        # Extract Linear issue URL
-        issue_id, issue_url = issue_parser.extract_linear_issue(text)
+        # Parse the issue reference and agent type out of the text in one place
+        mention = _parse_mention(text)
+        issue_id = mention.issue_id
         
         if not issue_id:
             say(
@@ -71,18 +148,18 @@ def handle_mention(event: Dict, say, ack):
             return
         
         # Determine which agent to trigger
-        agent_type = _determine_agent_type(text)
+        agent_type = mention.agent_type
         
         if not agent_type:
             say(
-                text="🤖 Please specify an agent type: developer, tester, or architect.\n"
+                text="🤖 Please specify an agent type: developer, tester, architect, or reviewer.\n"
                      "Example: `@bot developer implement feature X [Linear URL]`",
                 thread_ts=thread_ts
             )
             return
         
         # Extract task description
-        task_description = _extract_task_description(text, issue_url or issue_id)
+        task_description = _extract_task_description(text, mention.issue_reference)
         
         # Get project configuration from Linear issue
         project = _get_project_from_issue(issue_id)
@@ -119,10 +196,7 @@ def handle_mention(event: Dict, say, ack):
             "user": user
         }
         
-        # Import and dispatch the agent task
-        from agent_engine import AgentDispatcher
-        
-        agent_dispatcher = AgentDispatcher()
+        # Dispatch the agent task
         success = agent_dispatcher.dispatch_agent_task_with_callback(
             project=project,
             agent=agent,
@@ -146,126 +220,228 @@ def handle_mention(event: Dict, say, ack):
         )
 
 
+# Ack within Slack's 3 s window, then parse, post and dispatch on Bolt's lazy
+# listener thread pool so a slow mention doesn't hold up the next one
+app.event("app_mention")(ack=_ack_mention, lazy=[handle_mention])
+
+
 @app.event("message")
 def handle_message_events(event, logger):
     """Handle message events (required for Socket Mode)."""
     pass  # We only care about mentions
 
 
-def _determine_agent_type(text: str) -> Optional[str]:
-    """Determine which agent type was requested."""
-    text_lower = text.lower()
+@dataclass(frozen=True)
+class _ParsedMention:
+    """Everything handle_mention needs from a mention's text, parsed once."""
     
-    if any(word in text_lower for word in ['developer', 'dev', 'implement', 'code']):
-        return 'developer'
-    elif any(word in text_lower for word in ['tester', 'test', 'qa']):
-        return 'tester'
-    elif any(word in text_lower for word in ['architect', 'architecture', 'design']):
-        return 'architect'
+    text: str
+    issue_id: Optional[str]
+    issue_url: Optional[str]
+    agent_type: Optional[str]
     
-    return None
+    @property
+    def issue_reference(self) -> Optional[str]:
+        """The issue as written in the text: its URL if present, else its ID."""
+        return self.issue_url or self.issue_id
+
+
+@lru_cache(maxsize=1024)
+def _extract_linear_issue_cached(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """Memoized issue extraction; Slack retries and follow-ups resend the same text."""
+    return issue_parser.extract_linear_issue(text)
+
+
+def _parse_mention(text: str) -> _ParsedMention:
+    """Extract the Linear issue and requested agent type from a mention."""
+    issue_id, issue_url = _extract_linear_issue_cached(text)
+    if not issue_id:
+        # handle_mention bails out before it needs the agent type
+        return _ParsedMention(text, None, None, None)
+    return _ParsedMention(text, issue_id, issue_url, _determine_agent_type(text))
+
+
+def _determine_agent_type(text: str) -> Optional[str]:
+    """Determine which agent type was requested (the first keyword in the text wins)."""
+    # Most channel chatter names no agent; rule it out with plain substring
+    # checks before paying for a full regex scan
+    lowered = text.lower()
+    if not any(stem in lowered for stem in _AGENT_KEYWORD_STEMS):
+        return None
+    match = _AGENT_TYPE_RE.search(text)
+    return match.lastgroup if match else None
 
 
 def _extract_task_description(text: str, issue_reference: str) -> str:
     """Extract task description from message."""
     # Remove bot mention
-    text = re.sub(r'<@U\w+>', '', text).strip()
+    text = _BOT_MENTION_RE.sub('', text).strip()
     
     # Remove Linear URL or issue ID
     text = text.replace(issue_reference, '').strip()
     
     # Remove agent type keywords
-    keywords = ['developer', 'tester', 'architect', 'please', 'implement', 'test', 'design']
-    for keyword in keywords:
-        text = re.sub(rf'\b{keyword}\b', '', text, flags=re.IGNORECASE)
+    text = _TASK_KEYWORD_RE.sub('', text)
     
     return text.strip()
 
 
-def _get_project_from_issue(issue_id: str) -> Optional[Dict]:
-    """Get project configuration from Linear issue."""
-    # Load configuration
-    import json
+def _load_projects_cached() -> Optional[List[Dict]]:
+    """
+    Return the parsed config.json, re-reading it only when its mtime changes.
+    
+    If the file cannot be read, the last successfully parsed config is served
+    instead; None is returned only when nothing has been loaded yet.
+    """
     config_path = project_root / "config.json"
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
-        # For MVP, return first project (would need Linear API call to determine project)
-        # TODO: Implement Linear API call to get project from issue
-        return config[0] if config else None
+        cache_key = (str(config_path), os.stat(config_path).st_mtime_ns)
+        if _CONFIG_CACHE["key"] != cache_key:
+            with _CONFIG_LOCK:
+                # Another mention may have reloaded it while we waited
+                if _CONFIG_CACHE["key"] != cache_key:
+                    with open(config_path, 'r') as f:
+                        config = json.load(f)
+                    # Publish data before key so readers never pair a new key with old data
+                    _CONFIG_CACHE["agents_by_type"] = {
+                        id(project): (project, _index_agents_by_type(project))
+                        for project in config
+                    }
+                    _CONFIG_CACHE["data"] = config
+                    _CONFIG_CACHE["key"] = cache_key
+        return _CONFIG_CACHE["data"]
     except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        return None
+        config = _CONFIG_CACHE["data"]
+        if config is None:
+            logger.error(f"Failed to load configuration: {e}")
+            return None
+        logger.warning(f"Failed to reload configuration, using cached copy: {e}")
+        return config
 
 
-def _find_agent_by_type(project: Dict, agent_type: str) -> Optional[Dict]:
-    """Find agent configuration by type."""
-    agents = project.get('agents', [])
+def _clear_config_cache(*_signal_args) -> None:
+    """
+    Invalidate the cached config so the next lookup re-reads config.json (SIGHUP handler).
     
-    # Map agent types to mentions
-    type_to_mention = {
-        'developer': '@developer',
-        'tester': '@tester',
-        'architect': '@architect'
-    }
+    Only the key is reset: a single dict store needs no lock, so the handler
+    cannot deadlock against a reload it interrupted, and the cached data stays
+    available as the fallback if the re-read fails.
+    """
+    _CONFIG_CACHE["key"] = None
+
+
+def _get_project_from_issue(issue_id: str) -> Optional[Dict]:
+    """Get project configuration from Linear issue."""
+    config = _load_projects_cached()
     
-    mention = type_to_mention.get(agent_type)
-    if not mention:
+    # For MVP, return first project (would need Linear API call to determine project)
+    # TODO: Implement Linear API call to get project from issue
+    return config[0] if config else None
+
+
+def _index_agents_by_type(project: Dict) -> Dict[str, Dict]:
+    """Index a project's agents by type (their mention without the '@')."""
+    index: Dict[str, Dict] = {}
+    for agent in project.get('agents', []):
+        mention = agent.get('mention')
+        if mention:
+            index.setdefault(mention.lstrip('@'), agent)
+    return index
+
+
+def _find_agent_by_type(project: Dict, agent_type: str) -> Optional[Dict]:
+    """Find agent configuration by type."""
+    if agent_type not in _AGENT_TYPES:
         return None
     
-    for agent in agents:
-        if agent.get('mention') == mention:
-            return agent
+    entry = _CONFIG_CACHE["agents_by_type"].get(id(project))
+    if entry is not None and entry[0] is project:
+        return entry[1].get(agent_type)
     
-    return None
+    # Project didn't come from the cached config; index its agents directly
+    return _index_agents_by_type(project).get(agent_type)
 
 
-def _slack_progress_callback(context: Dict, status: str, message: str):
-    """Callback to report progress to Slack thread."""
-    channel = context.get('channel')
-    thread_ts = context.get('thread_ts')
+def _slack_progress_callback(context: Dict, status: str, message: str) -> Optional[Future]:
+    """
+    Callback to report progress to Slack thread.
     
-    if not channel or not thread_ts:
-        return
+    Updates for the same thread that arrive within _PROGRESS_BATCH_WINDOW are
+    posted together as one message from the shared Slack I/O executor; a timer
+    closes the window so no executor worker sits idle waiting for it. The call
+    returns immediately with the Future of that post, or None if the context is
+    incomplete.
+    """
+    if not (channel := context.get('channel')) or not (thread_ts := context.get('thread_ts')):
+        return None
     
-    # Map status to emoji
-    emoji_map = {
-        'started': '🔄',
-        'success': '✅',
-        'failed': '❌',
-        'testing': '🧪',
-        'committing': '💾'
-    }
+    line = _STATUS_PREFIX.get(status, _DEFAULT_STATUS_PREFIX) + message
+    key = (channel, thread_ts)
     
-    emoji = emoji_map.get(status, '📝')
+    # Join the pending batch for this thread, or start one and schedule its flush
+    with _PROGRESS_LOCK:
+        batch = _PROGRESS_BATCHES.get(key)
+        if batch is None:
+            batch = _PROGRESS_BATCHES[key] = ([], Future())
+            timer = threading.Timer(
+                _PROGRESS_BATCH_WINDOW, _flush_progress_updates,
+                args=(app.client, channel, thread_ts)
+            )
+            timer.daemon = True
+            timer.start()
+        batch[0].append(line)
     
+    return batch[1]
+
+
+def _flush_progress_updates(client, channel: str, thread_ts: str) -> None:
+    """Close a thread's batch and hand its updates to the Slack I/O executor as one post."""
+    with _PROGRESS_LOCK:
+        lines, future = _PROGRESS_BATCHES.pop((channel, thread_ts))
+    posted = _SLACK_IO.submit(_post_progress_update, client, channel, thread_ts, "\n".join(lines))
+    posted.add_done_callback(lambda done: _copy_future_outcome(done, future))
+
+
+def _copy_future_outcome(source: Future, target: Future) -> None:
+    """Resolve ``target`` with the result or exception of the finished ``source``."""
+    if (error := source.exception()) is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
+
+
+def _post_progress_update(client, channel: str, thread_ts: str, text: str) -> None:
+    """Post a progress update to a Slack thread (runs on the Slack I/O executor)."""
     try:
-        app.client.chat_postMessage(
+        client.chat_postMessage(
             channel=channel,
             thread_ts=thread_ts,
-            text=f"{emoji} {message}"
+            text=text
         )
     except Exception as e:
         logger.error(f"Failed to send Slack update: {e}")
 
 
-def start_slack_bot():
-    """Start the Slack bot in Socket Mode."""
+def start_slack_bot(env: Mapping[str, str] = os.environ):
+    """Start the Slack bot in Socket Mode, reading its tokens from ``env``."""
     try:
         # Validate required environment variables
         required_vars = ["SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "SLACK_SIGNING_SECRET"]
-        missing_vars = [var for var in required_vars if not os.environ.get(var)]
+        missing_vars = [var for var in required_vars if not env.get(var)]
         
         if missing_vars:
             logger.error(f"Missing required Slack environment variables: {', '.join(missing_vars)}")
             sys.exit(1)
         
+        # `kill -HUP` forces config.json to be re-read on the next mention
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, _clear_config_cache)
+        
         logger.info("Starting Slack bot in Socket Mode...")
         
         # Use Socket Mode for easier development (no public URL needed)
-        handler = SocketModeHandler(app, os.environ["SLACK_APP_TOKEN"])
+        handler = SocketModeHandler(app, env["SLACK_APP_TOKEN"])
         handler.start()
         
     except Exception as e:
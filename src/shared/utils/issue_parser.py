@@ -3,9 +3,28 @@ Utility for parsing Linear issue references from text.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
+# Full or bare linear.app issue URL, matched in a single scan of the text
+_LINEAR_URL_RE = re.compile(r'(https://)?\blinear\.app/[\w-]+/issue/([\w-]+)')
+
+# Short form like ABC-123, Abc-123, or A1B-456 with word boundaries
+_SHORT_ISSUE_RE = re.compile(r'\b([A-Za-z][A-Za-z0-9]*-\d+)\b')
+
+# Uppercase letters/numbers followed by hyphen and positive number
+# (used with fullmatch, which also rejects the trailing newline that `$` allows)
+_VALID_ISSUE_ID_RE = re.compile(r'[A-Z][A-Z0-9]*-[1-9]\d*')
+
+
+@lru_cache(maxsize=512)
+def _url_exclusion_pattern(issue_id: str) -> re.Pattern:
+    """Compiled pattern matching a URL that contains the given issue ID."""
+    # Pattern: protocol://domain/path/containing/the/issue-id
+    return re.compile(r'https?://[^\s]+/[^\s]*?' + re.escape(issue_id) + r'[^\s]*')
+
+
 class LinearIssueParser:
     """Parser for extracting Linear issue information from text."""
     
@@ -13,10 +32,11 @@ class LinearIssueParser:
     LINEAR_URL_PATTERNS = [
         r'https://linear\.app/[\w-]+/issue/([\w-]+)',
         r'\blinear\.app/[\w-]+/issue/([\w-]+)',  # Use word boundary to avoid matching subdomains
-        r'\b([A-Za-z][A-Za-z0-9]*-\d+)\b'  # Short form like ABC-123, Abc-123, or A1B-456 with word boundaries
+        _SHORT_ISSUE_RE.pattern
     ]
     
-    def extract_linear_issue(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+    @staticmethod
+    def extract_linear_issue(text: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract Linear issue ID and URL from text.
         
@@ -26,21 +46,23 @@ class LinearIssueParser:
         Returns:
             Tuple of (issue_id, full_url) or (None, None) if not found
         """
-        # First try to find full URL (only valid linear.app URLs)
-        for pattern in self.LINEAR_URL_PATTERNS[:2]:
-            match = re.search(pattern, text)
-            if match:
-                issue_id = match.group(1)
-                full_url = match.group(0)
-                if not full_url.startswith('https://'):
-                    full_url = 'https://' + full_url
-                return issue_id, full_url
+        # First try to find full URL (only valid linear.app URLs). The substring
+        # checks are plain C scans that let most text skip the regex passes.
+        match = _LINEAR_URL_RE.search(text) if 'linear.app' in text else None
+        if match:
+            issue_id = match.group(2)
+            full_url = match.group(0)
+            if not match.group(1):
+                full_url = 'https://' + full_url
+            return issue_id, full_url
         
-        # Try short form only if not part of a URL (including non-linear.app URLs)
-        short_pattern = self.LINEAR_URL_PATTERNS[2]
+        # Every short-form ID contains a hyphen
+        if '-' not in text:
+            return None, None
         
+        # Try short form only if not part of a URL (including non-linear.app URLs)
         # Find all potential matches in order (first to last)
-        for match in re.finditer(short_pattern, text):
+        for match in _SHORT_ISSUE_RE.finditer(text):
             issue_id = match.group(1)
             start_pos = match.start()
             end_pos = match.end()
@@ -52,9 +74,7 @@ class LinearIssueParser:
             context = text[url_context_start:url_context_end]
             
             # Check if the issue ID appears within a URL structure
-            # Pattern: protocol://domain/path/containing/the/issue-id
-            url_pattern = r'https?://[^\s]+/[^\s]*?' + re.escape(issue_id) + r'[^\s]*'
-            if re.search(url_pattern, context):
+            if _url_exclusion_pattern(issue_id).search(context):
                 continue  # Skip if part of URL
                 
             # We found a standalone issue ID - return the first valid one found
@@ -62,7 +82,8 @@ class LinearIssueParser:
         
         return None, None
     
-    def validate_issue_id(self, issue_id: str) -> bool:
+    @staticmethod
+    def validate_issue_id(issue_id: str) -> bool:
         """
         Validate that an issue ID follows Linear's format.
         
@@ -73,6 +94,9 @@ class LinearIssueParser:
             True if valid, False otherwise
         """
         # Linear issue IDs are typically ABC-123 format
-        # Must be uppercase letters/numbers followed by hyphen and positive number
-        pattern = r'^[A-Z][A-Z0-9]*\-[1-9]\d*$'
-        return bool(re.match(pattern, issue_id))
\ No newline at end of file
+        return bool(_VALID_ISSUE_ID_RE.fullmatch(issue_id))
+
+
+# Module-level aliases for callers that don't need a parser instance
+extract_linear_issue = LinearIssueParser.extract_linear_issue
+validate_issue_id = LinearIssueParser.validate_issue_id
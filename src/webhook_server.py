@@ -13,19 +13,23 @@ Phase 1 MVP Implementation:
 - Returns immediate HTTP 202 Accepted response
 """
 
+import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import os
+import re
+import shlex
+import ssl
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request, status
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 import uvicorn
 from dotenv import load_dotenv
 
@@ -47,14 +51,22 @@ app = FastAPI(
 )
 
 
+# Agent mentions such as @developer; the match includes the leading "@"
+_MENTION_RE = re.compile(r'@\w+')
+
+
 class LinearWebhookPayload(BaseModel):
     """Pydantic model for Linear webhook payload validation."""
+    # Unknown top-level keys are dropped rather than stored on the model
+    model_config = ConfigDict(extra="ignore")
+    
     action: str
     data: Dict[str, Any]
     type: str
-    createdAt: str
-    organizationId: str
-    webhookId: str
+    # Envelope metadata is never read by the dispatcher, so it is optional
+    createdAt: Optional[str] = None
+    organizationId: Optional[str] = None
+    webhookId: Optional[str] = None
 
 
 class WebhookResponse(BaseModel):
@@ -70,76 +82,172 @@ class ConfigManager:
     def __init__(self, config_path: str = "config.json"):
         self.config_path = Path(config_path)
         self._config_cache: Optional[List[Dict[str, Any]]] = None
+        self._config_mtime_ns: Optional[int] = None
+        self._projects_by_id: Dict[str, Dict[str, Any]] = {}
+        self._agents_by_mention: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._projects_by_slack_channel: Dict[str, Dict[str, Any]] = {}
+        self._agents_by_slack_bot_id: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def load_config(self) -> List[Dict[str, Any]]:
-        """Load and cache the configuration file."""
-        if self._config_cache is None:
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config_cache = json.load(f)
-                logger.info(f"Loaded configuration from {self.config_path}")
-            except FileNotFoundError:
-                logger.error(f"Configuration file not found: {self.config_path}")
+        """Load and cache the configuration file, re-reading it when its mtime changes."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            if self._config_cache is None or mtime_ns != self._config_mtime_ns:
+                with open(self.config_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+                self._build_indexes(config)
+                self._config_cache = config
+                self._config_mtime_ns = mtime_ns
+                logger.info("Loaded configuration from %s", self.config_path)
+        except OSError as e:
+            # Covers a missing file too, e.g. while an editor replaces it
+            if self._config_cache is None:
+                logger.error("Cannot read configuration file %s: %s", self.config_path, e)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Configuration file not found"
+                    detail=("Configuration file not found" if isinstance(e, FileNotFoundError)
+                            else "Configuration file could not be read")
                 )
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in configuration file: {e}")
+            logger.warning("Cannot re-read configuration file %s, using cached copy: %s",
+                           self.config_path, e)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON in configuration file: %s", e)
+            if self._config_cache is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Invalid configuration file format"
                 )
+            # Keep serving the last valid configuration until the file is fixed
         return self._config_cache
     
+    def _build_indexes(self, config: List[Dict[str, Any]]) -> None:
+        """Index projects by Linear project ID and Slack channel, and agents by mention and Slack bot ID."""
+        projects_by_id: Dict[str, Dict[str, Any]] = {}
+        agents_by_mention: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        projects_by_slack_channel: Dict[str, Dict[str, Any]] = {}
+        agents_by_slack_bot_id: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for project in config:
+            project_id = project.get("linearProjectId")
+            # setdefault keeps the first entry, matching the previous linear scans
+            kept_project = projects_by_id.setdefault(project_id, project) is project
+            channel_id = project.get("slackChannelId")
+            if channel_id in projects_by_slack_channel:
+                logger.warning(
+                    "Slack channel %s is mapped to several projects; using %s",
+                    channel_id, projects_by_slack_channel[channel_id].get("linearProjectId")
+                )
+            elif channel_id:
+                projects_by_slack_channel[channel_id] = project
+            # A later entry with the same ID is unreachable by ID, so its agents
+            # must not be merged into the kept project's indexes
+            if not kept_project:
+                logger.warning(
+                    "Linear project %s appears more than once in the config; using the first entry",
+                    project_id
+                )
+                continue
+            agents = agents_by_mention[project_id] = {}
+            bot_agents = agents_by_slack_bot_id[project_id] = {}
+            for agent in project.get("agents", []):
+                agents.setdefault(agent.get("mention"), agent)
+                if agent.get("slackBotId"):
+                    bot_agents.setdefault(agent["slackBotId"], agent)
+        self._projects_by_id = projects_by_id
+        self._agents_by_mention = agents_by_mention
+        self._projects_by_slack_channel = projects_by_slack_channel
+        self._agents_by_slack_bot_id = agents_by_slack_bot_id
+    
     def find_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Find project configuration by Linear project ID."""
-        config = self.load_config()
-        for project in config:
-            if project.get("linearProjectId") == project_id:
-                return project
-        return None
+        self.load_config()
+        return self._projects_by_id.get(project_id)
+    
+    def agents_by_mention(self, project: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Return the project's agents keyed by mention string."""
+        project_id = project.get("linearProjectId")
+        if self._projects_by_id.get(project_id) is project:
+            return self._agents_by_mention[project_id]
+        
+        # Project didn't come from the loaded config; index its agents directly
+        agents: Dict[str, Dict[str, Any]] = {}
+        for agent in project.get("agents", []):
+            agents.setdefault(agent.get("mention"), agent)
+        return agents
     
     def find_agent_by_mention(self, project: Dict[str, Any], mention: str) -> Optional[Dict[str, Any]]:
         """Find agent configuration by mention string."""
-        agents = project.get("agents", [])
-        for agent in agents:
-            if agent.get("mention") == mention:
+        return self.agents_by_mention(project).get(mention)
+    
+    def find_project_by_slack_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """Find project configuration by its Slack channel ID."""
+        self.load_config()
+        return self._projects_by_slack_channel.get(channel_id)
+    
+    def find_agent_by_slack_bot_id(self, project: Dict[str, Any], bot_id: str) -> Optional[Dict[str, Any]]:
+        """Find agent configuration by Slack bot user ID."""
+        project_id = project.get("linearProjectId")
+        if self._projects_by_id.get(project_id) is project:
+            return self._agents_by_slack_bot_id[project_id].get(bot_id)
+        
+        # Project didn't come from the loaded config; scan its agents directly
+        for agent in project.get("agents", []):
+            if agent.get("slackBotId") == bot_id:
                 return agent
         return None
 
 
+def _hmac_backend() -> str:
+    """Describe the SHA-256 implementation used for HMAC (OpenSSL or CPython builtin)."""
+    if hashlib.sha256.__name__.startswith("openssl_"):
+        return ssl.OPENSSL_VERSION
+    return "CPython builtin _sha256"
+
+
 class WebhookValidator:
     """Handles webhook signature validation for security."""
     
     def __init__(self, webhook_secret: Optional[str] = None):
         self.webhook_secret = webhook_secret or os.getenv("LINEAR_WEBHOOK_SECRET")
+        self._secret_bytes: Optional[bytes] = None
+        # Chosen once here, so requests never re-check whether a secret is configured
+        self._validate: Callable[[bytes, Optional[str]], bool]
         if not self.webhook_secret:
             logger.warning("No webhook secret configured - signature validation disabled")
+            self._validate = self._skip_signature_validation
+        else:
+            self._secret_bytes = self.webhook_secret.encode('utf-8')
+            # Keyed once here; each request copies it to skip the ipad/opad setup
+            self._hmac_proto: hmac.HMAC = hmac.new(self._secret_bytes, None, hashlib.sha256)
+            self._validate = self._validate_hmac
+            logger.info("Webhook signature HMAC-SHA256 backend: %s", _hmac_backend())
     
     def validate_signature(self, payload: bytes, signature: Optional[str]) -> bool:
-        """Validate Linear webhook signature using HMAC-SHA256."""
-        if not self.webhook_secret:
-            logger.warning("Webhook signature validation skipped - no secret configured")
-            return True
-        
+        """Validate Linear webhook signature using HMAC-SHA256 (accepts all when no secret is set)."""
+        return self._validate(payload, signature)
+    
+    def _skip_signature_validation(self, payload: bytes, signature: Optional[str]) -> bool:
+        """Accept every request; the missing secret was logged once at construction."""
+        return True
+    
+    def _validate_hmac(self, payload: bytes, signature: Optional[str]) -> bool:
+        """Check the signature against the HMAC-SHA256 of the payload."""
         if not signature:
             logger.error("No signature provided in webhook request")
             return False
         
-        # Remove 'sha256=' prefix if present
-        if signature.startswith("sha256="):
-            signature = signature[7:]
+        # Decode the hex signature (minus any 'sha256=' prefix) and compare raw 32-byte digests
+        try:
+            signature_bytes = bytes.fromhex(signature.removeprefix("sha256="))
+        except ValueError:
+            logger.error("Malformed webhook signature")
+            return False
         
-        # Calculate expected signature
-        expected_signature = hmac.new(
-            self.webhook_secret.encode('utf-8'),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
+        # Calculate expected digest from the pre-keyed prototype
+        mac = self._hmac_proto.copy()
+        mac.update(payload)
         
         # Compare signatures using secure comparison
-        is_valid = hmac.compare_digest(expected_signature, signature)
+        is_valid = hmac.compare_digest(mac.digest(), signature_bytes)
         
         if not is_valid:
             logger.error("Invalid webhook signature")
@@ -176,23 +284,25 @@ class PayloadParser:
             return comment_data
             
         except (KeyError, TypeError) as e:
-            logger.error(f"Error parsing comment data from payload: {e}")
+            logger.error("Error parsing comment data from payload: %s", e)
             return None
     
     @staticmethod
     def find_agent_mentions(comment_body: str) -> List[str]:
         """Find all agent mentions in comment body (e.g., @developer, @tester)."""
-        import re
-        mention_pattern = r'@(\w+)'
-        mentions = re.findall(mention_pattern, comment_body)
-        return [f"@{mention}" for mention in mentions]
+        if "@" not in comment_body:
+            return []
+        return _MENTION_RE.findall(comment_body)
 
 
 class AgentDispatcher:
     """Handles dispatching tasks to the agent engine."""
     
     def __init__(self, agent_engine_path: str = "src/agent_engine.py"):
-        self.agent_engine_path = Path(agent_engine_path)
+        # Resolve once so the child never depends on a cwd change
+        self.agent_engine_path = Path(agent_engine_path).resolve()
+        # Interpreter and script are fixed for the process lifetime
+        self._cmd_prefix = (sys.executable, str(self.agent_engine_path))
     
     def dispatch_agent_task(
         self,
@@ -209,8 +319,7 @@ class AgentDispatcher:
         try:
             # Prepare command line arguments
             cmd = [
-                sys.executable,
-                str(self.agent_engine_path),
+                *self._cmd_prefix,
                 "--issue-id", issue_id,
                 "--project-path", project["repoPath"],
                 "--agent-role", agent["role"],
@@ -224,25 +333,35 @@ class AgentDispatcher:
             # Add project name for context
             cmd.extend(["--project-name", project["projectName"]])
             
-            logger.info(f"Dispatching agent task: {' '.join(cmd)}")
+            logger.info("Dispatching %s agent task for issue %s", agent["role"], issue_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Agent command: %s", shlex.join(cmd))
             
-            # Start subprocess in background (non-blocking)
+            # Start subprocess in background (non-blocking). Output is never
+            # read, so discard it rather than let a full pipe stall the child;
+            # a new session keeps the agent alive if this worker exits.
+            # No preexec_fn and no cwd keeps CPython on its vfork() fast path
+            # instead of copying the server's page tables on every dispatch.
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=Path.cwd()
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True
             )
             
-            logger.info(f"Agent task dispatched successfully with PID: {process.pid}")
+            logger.info("Agent task dispatched successfully with PID: %s", process.pid)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to dispatch agent task: {e}")
+            logger.error("Failed to dispatch agent task: %s", e)
             return False
 
 
+# Bodies larger than this are HMAC'd in a worker thread (~50us of hashing)
+HMAC_OFFLOAD_THRESHOLD = 64 * 1024
+
 # Initialize global components
 config_manager = ConfigManager()
 webhook_validator = WebhookValidator()
@@ -267,8 +386,28 @@ async def root():
     }
 
 
+def _dispatch_in_background(
+    project: Dict[str, Any],
+    agent: Dict[str, Any],
+    issue_id: str,
+    comment_body: str,
+    mention: str
+) -> None:
+    """Dispatch an agent task from a background task (runs in the threadpool)."""
+    success = agent_dispatcher.dispatch_agent_task(
+        project=project,
+        agent=agent,
+        issue_id=issue_id,
+        comment_body=comment_body
+    )
+    if success:
+        logger.info("Successfully dispatched task for %s", mention)
+    else:
+        logger.error("Failed to dispatch task for %s", mention)
+
+
 @app.post("/webhook/linear", response_model=WebhookResponse)
-async def process_linear_webhook(request: Request):
+async def process_linear_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Process Linear webhook events.
     
@@ -280,38 +419,63 @@ async def process_linear_webhook(request: Request):
     5. Returns immediate HTTP 202 Accepted response
     """
     try:
-        # Get request body and signature
-        body = await request.body()
+        # Get request body and signature. The raw bytes are shared by the
+        # HMAC check and the JSON parser; the body is never decoded to str.
+        body: bytes = await request.body()
         signature = request.headers.get("Linear-Signature")
         
-        # Validate webhook signature
-        if not webhook_validator.validate_signature(body, signature):
+        # Validate webhook signature, hashing large bodies off the event loop
+        if len(body) > HMAC_OFFLOAD_THRESHOLD:
+            is_valid = await asyncio.to_thread(webhook_validator.validate_signature, body, signature)
+        else:
+            is_valid = webhook_validator.validate_signature(body, signature)
+        
+        if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid webhook signature"
             )
         
-        # Parse JSON payload
-        try:
-            payload = json.loads(body.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON payload: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid JSON payload"
+        # Most Linear traffic is issue/project updates. A body that doesn't
+        # even contain the "Comment"/"create" tokens can't be a comment event,
+        # so only check it is well-formed JSON and skip the model validation.
+        if b'"Comment"' not in body or b'"create"' not in body:
+            try:
+                orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                logger.error("Invalid JSON payload: %s", e)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid JSON payload"
+                )
+            logger.info("Webhook received but not a comment event")
+            return WebhookResponse(
+                message="Webhook received but not a comment event",
+                dispatched=False
             )
         
-        # Validate payload structure
+        # Parse and validate the JSON payload in a single pass
         try:
-            validated_payload = LinearWebhookPayload(**payload)
-        except Exception as e:
-            logger.error(f"Invalid webhook payload structure: {e}")
+            validated_payload = LinearWebhookPayload.model_validate_json(body)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.error("Invalid JSON payload: %s", e)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid JSON payload"
+                )
+            logger.error("Invalid webhook payload structure: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid webhook payload structure"
             )
         
         # Extract comment data
+        payload = {
+            "type": validated_payload.type,
+            "action": validated_payload.action,
+            "data": validated_payload.data
+        }
         comment_data = payload_parser.extract_comment_data(payload)
         if not comment_data:
             # Not a comment event or missing data - return success but don't dispatch
@@ -332,41 +496,43 @@ async def process_linear_webhook(request: Request):
         
         project = config_manager.find_project_by_id(project_id)
         if not project:
-            logger.warning(f"Unknown project ID: {project_id}")
+            logger.warning("Unknown project ID: %s", project_id)
             return WebhookResponse(
                 message=f"Unknown project ID: {project_id}",
                 dispatched=False
             )
         
-        # Find agent mentions in comment
+        # Scan the comment for mentions and resolve each against the project's
+        # agent index in the same pass. The agent subprocesses are queued as
+        # background tasks and spawned after the response has been sent.
         comment_body = comment_data["comment_body"]
-        mentions = payload_parser.find_agent_mentions(comment_body)
-        
-        if not mentions:
-            logger.info("No agent mentions found in comment")
-            return WebhookResponse(
-                message="No agent mentions found in comment",
-                dispatched=False
-            )
-        
-        # Dispatch tasks for each mentioned agent
+        agents = config_manager.agents_by_mention(project)
+        mention_found = False
         dispatched_count = 0
-        for mention in mentions:
-            agent = config_manager.find_agent_by_mention(project, mention)
+        matches = _MENTION_RE.finditer(comment_body) if "@" in comment_body else ()
+        for match in matches:
+            mention_found = True
+            mention = match.group(0)
+            agent = agents.get(mention)
             if agent:
-                success = agent_dispatcher.dispatch_agent_task(
+                background_tasks.add_task(
+                    _dispatch_in_background,
                     project=project,
                     agent=agent,
                     issue_id=comment_data["issue_id"],
-                    comment_body=comment_body
+                    comment_body=comment_body,
+                    mention=mention
                 )
-                if success:
-                    dispatched_count += 1
-                    logger.info(f"Successfully dispatched task for {mention}")
-                else:
-                    logger.error(f"Failed to dispatch task for {mention}")
+                dispatched_count += 1
             else:
-                logger.warning(f"Unknown agent mention: {mention} for project {project['projectName']}")
+                logger.warning("Unknown agent mention: %s for project %s", mention, project["projectName"])
+        
+        if not mention_found:
+            logger.info("No agent mentions found in comment")
+            return WebhookResponse(
+                message="No agent mentions found in comment",
+                dispatched=False
+            )
         
         # Return response
         if dispatched_count > 0:
@@ -384,7 +550,7 @@ async def process_linear_webhook(request: Request):
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        logger.error(f"Unexpected error processing webhook: {e}")
+        logger.error("Unexpected error processing webhook: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error processing webhook"
@@ -396,14 +562,20 @@ if __name__ == "__main__":
     host = os.getenv("WEBHOOK_HOST", "0.0.0.0")
     port = int(os.getenv("WEBHOOK_PORT", "8000"))
     debug = os.getenv("DEBUG", "false").lower() == "true"
+    # Each worker process keeps its own config cache; reload mode is single-process
+    workers = 1 if debug else int(os.getenv("WEBHOOK_WORKERS", "1"))
     
-    logger.info(f"Starting Multi-Agent TDD Webhook Dispatcher on {host}:{port}")
+    logger.info("Starting Multi-Agent TDD Webhook Dispatcher on %s:%s (%s worker(s))", host, port, workers)
     
-    # Run the server
+    # Run the server on uvloop + httptools (installed by uvicorn[standard];
+    # uvloop has no Windows build, so fall back to the stdlib loop there)
     uvicorn.run(
         "webhook_server:app",
         host=host,
         port=port,
         reload=debug,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info" if not debug else "debug"
     )
\ No newline at end of file
@@ -2,39 +2,29 @@
 Pytest configuration and fixtures for Multi-Agent TDD System tests.
 """
 
+import orjson
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 import os
+import sys
 
-# Import Slack fixtures
-from tests.fixtures.slack_fixtures import (
-    sample_slack_workspace_id,
-    sample_slack_channel_ids, 
-    sample_slack_user_ids,
-    sample_slack_bot_ids,
-    sample_linear_issues,
-    slack_app_mention_event,
-    slack_threaded_mention_event,
-    slack_ambiguous_mention_event,
-    slack_mention_without_linear_url,
-    slack_config_complete,
-    slack_config_legacy,
-    slack_config_partial,
-    mock_slack_api_responses,
-    mock_slack_client,
-    mock_slack_web_client,
-    mock_linear_issue_parser,
-    mock_agent_dispatcher,
-    slack_progress_callback_context,
-    slack_bot_app_instance,
-    slack_event_builder,
-    slack_api_response_builder,
-    slack_signature_helper,
-    multiple_linear_issues,
-    large_slack_event,
-    config_transformation_helpers
-)
+# Put src/ on the import path once for every test module. (pytest.ini takes
+# precedence over pyproject.toml, and its [tool:pytest] section is not read,
+# so pytest's own `pythonpath` option isn't available here.)
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Slack fixtures are registered as a plugin instead of being imported here
+pytest_plugins = ["tests.fixtures.slack_fixtures"]
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Provide a thread pool shared by concurrency tests."""
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        yield pool
 
 
 @pytest.fixture
@@ -43,10 +33,10 @@ def test_data_dir():
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def temp_config_file(tmp_path):
-    """Create a temporary configuration file for testing."""
-    config_file = tmp_path / "test_config.json"
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary configuration file shared by the test session."""
+    config_file = tmp_path_factory.mktemp("cfg") / "test_config.json"
     config_content = """
     [
         {
@@ -67,10 +57,16 @@ def temp_config_file(tmp_path):
     return config_file
 
 
-@pytest.fixture
-def temp_slack_config_file(tmp_path):
-    """Create a temporary Slack-enabled configuration file for testing."""
-    config_file = tmp_path / "test_slack_config.json"
+@pytest.fixture(scope="session")
+def temp_config_data(temp_config_file):
+    """Provide the parsed contents of temp_config_file."""
+    return orjson.loads(temp_config_file.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def temp_slack_config_file(tmp_path_factory):
+    """Create a temporary Slack-enabled configuration file shared by the test session."""
+    config_file = tmp_path_factory.mktemp("cfg") / "test_slack_config.json"
     config_content = """
     [
         {
@@ -125,21 +121,9 @@ def mock_slack_environment_missing():
 
 
 @pytest.fixture
-def mock_slack_bolt_app():
-    """Provide mock Slack Bolt App instance for testing."""
-    mock_app = Mock()
-    mock_app.client = Mock()
-    
-    # Configure common client methods
-    mock_app.client.chat_postMessage.return_value = {"ok": True}
-    mock_app.client.files_upload.return_value = {"ok": True}
-    mock_app.client.users_info.return_value = {
-        "ok": True,
-        "user": {"id": "U123", "name": "testuser"}
-    }
-    mock_app.client.reactions_add.return_value = {"ok": True}
-    
-    return mock_app
+def mock_slack_bolt_app(mock_slack_web_client):
+    """Provide stub Slack Bolt App instance for testing."""
+    return SimpleNamespace(client=mock_slack_web_client)
 
 
 @pytest.fixture(autouse=True)
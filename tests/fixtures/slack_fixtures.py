@@ -11,7 +11,11 @@ Provides:
 
 import pytest
 from typing import Dict, List, Any, Optional
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
+import functools
+import hashlib
+import hmac
 import json
 import time
 
@@ -59,356 +63,426 @@ SAMPLE_LINEAR_ISSUES = {
 }
 
 
-@pytest.fixture
+def _ro(mapping: Dict[str, Any]) -> MappingProxyType:
+    """Wrap shared fixture data in a read-only view."""
+    return MappingProxyType(mapping)
+
+
+# Event payloads are built once and handed out as read-only views; no test
+# modifies them (copy with dict() first if one needs to)
+_EVENT_APP_MENTION = {
+    "type": "app_mention",
+    "user": SAMPLE_SLACK_IDS["users"]["alice"],
+    "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer implement user auth {SAMPLE_LINEAR_ISSUES['feature_request']['url']}",
+    "ts": "1234567890.123456",
+    "channel": SAMPLE_SLACK_IDS["channels"]["general"],
+    "thread_ts": None,
+    "event_ts": "1234567890.123456"
+}
+
+_EVENT_THREADED = {
+    "type": "app_mention",
+    "user": SAMPLE_SLACK_IDS["users"]["bob"],
+    "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> tester add tests for {SAMPLE_LINEAR_ISSUES['test_task']['url']}",
+    "ts": "1234567891.123456",
+    "channel": SAMPLE_SLACK_IDS["channels"]["dev-team"],
+    "thread_ts": "1234567890.000000",  # Original thread timestamp
+    "event_ts": "1234567891.123456"
+}
+
+_EVENT_AMBIGUOUS = {
+    "type": "app_mention",
+    "user": SAMPLE_SLACK_IDS["users"]["charlie"],
+    "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> please help with {SAMPLE_LINEAR_ISSUES['bug_report']['url']}",
+    "ts": "1234567892.123456", 
+    "channel": SAMPLE_SLACK_IDS["channels"]["qa-team"],
+    "event_ts": "1234567892.123456"
+}
+
+_EVENT_NO_URL = {
+    "type": "app_mention",
+    "user": SAMPLE_SLACK_IDS["users"]["alice"],
+    "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer implement something",
+    "ts": "1234567893.123456",
+    "channel": SAMPLE_SLACK_IDS["channels"]["general"],
+    "event_ts": "1234567893.123456"
+}
+
+
+# Configurations and API responses are read-only in tests and shared as-is;
+# configs stay plain lists because the code under test serializes them
+_CONFIG_COMPLETE = [
+    {
+        "linearProjectId": "61c8a2f4-8b74-4f5c-9b3e-2a1d5e7f8c9d",
+        "projectName": "Multi-Agent TDD System - Core Engine",
+        "repoPath": "/home/test/projects/ClaudeCode_MultiAgentTDDEngine",
+        "slackChannelId": SAMPLE_SLACK_IDS["channels"]["general"],
+        "slackWorkspaceId": SAMPLE_SLACK_IDS["workspace"],
+        "agents": [
+            {
+                "mention": "@developer",
+                "slackBotId": SAMPLE_SLACK_IDS["bots"]["developer_agent"],
+                "role": "Senior Python Developer specializing in clean architecture and FastAPI development",
+                "testCommand": "pytest tests/ -v --cov=src --cov-report=term-missing"
+            },
+            {
+                "mention": "@tester",
+                "slackBotId": SAMPLE_SLACK_IDS["bots"]["tester_agent"],
+                "role": "Software Quality Engineer specializing in TDD and comprehensive test coverage",
+                "testCommand": "pytest tests/ -v --tb=short"
+            },
+            {
+                "mention": "@reviewer",
+                "slackBotId": SAMPLE_SLACK_IDS["bots"]["reviewer_agent"],
+                "role": "Software Architect specializing in clean architecture and system design",
+                "testCommand": "pytest tests/integration/ -v"
+            }
+        ]
+    }
+]
+
+_CONFIG_LEGACY = [
+    {
+        "linearProjectId": "legacy-project-id",
+        "projectName": "Legacy Project",
+        "repoPath": "/path/to/legacy/project",
+        "agents": [
+            {
+                "mention": "@developer",
+                "role": "Senior Developer",
+                "testCommand": "pytest"
+            },
+            {
+                "mention": "@tester",
+                "role": "QA Engineer", 
+                "testCommand": "pytest tests/"
+            }
+        ]
+    }
+]
+
+_CONFIG_PARTIAL = [
+    {
+        "linearProjectId": "partial-project-id",
+        "projectName": "Partially Migrated Project",
+        "repoPath": "/path/to/partial/project",
+        "slackChannelId": SAMPLE_SLACK_IDS["channels"]["dev-team"],
+        # Missing slackWorkspaceId
+        "agents": [
+            {
+                "mention": "@developer",
+                "slackBotId": SAMPLE_SLACK_IDS["bots"]["developer_agent"],
+                "role": "Senior Developer",
+                "testCommand": "pytest"
+            },
+            {
+                "mention": "@tester",
+                # Missing slackBotId
+                "role": "QA Engineer",
+                "testCommand": "pytest tests/"
+            }
+        ]
+    }
+]
+
+_PROGRESS_CALLBACK_CONTEXT = {
+    "channel": SAMPLE_SLACK_IDS["channels"]["general"],
+    "thread_ts": "1234567890.123456",
+    "user": SAMPLE_SLACK_IDS["users"]["alice"]
+}
+
+_API_RESPONSES = {
+    "chat_postMessage_success": {
+        "ok": True,
+        "channel": SAMPLE_SLACK_IDS["channels"]["general"],
+        "ts": "1234567890.123456",
+        "message": {
+            "type": "message",
+            "subtype": "bot_message",
+            "text": "Hello from bot!",
+            "ts": "1234567890.123456",
+            "username": "TDD Bot",
+            "bot_id": SAMPLE_SLACK_IDS["bots"]["tdd_bot"]
+        }
+    },
+    "chat_postMessage_error": {
+        "ok": False,
+        "error": "channel_not_found"
+    },
+    "files_upload_success": {
+        "ok": True,
+        "file": {
+            "id": "F1234567890",
+            "name": "test_report.pdf",
+            "title": "Test Report",
+            "mimetype": "application/pdf",
+            "filetype": "pdf",
+            "url_private": "https://files.slack.com/files-pri/T123/F123/test_report.pdf"
+        }
+    },
+    "users_info_success": {
+        "ok": True,
+        "user": {
+            "id": SAMPLE_SLACK_IDS["users"]["alice"],
+            "name": "alice.developer",
+            "real_name": "Alice Developer",
+            "email": "alice@company.com",
+            "is_bot": False,
+            "is_admin": False,
+            "profile": {
+                "display_name": "Alice D.",
+                "status_text": "Building great software",
+                "status_emoji": ":computer:"
+            }
+        }
+    },
+    "reactions_add_success": {
+        "ok": True
+    },
+    "reactions_add_already_reacted": {
+        "ok": False,
+        "error": "already_reacted"
+    }
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cache_linear_issue_parsing():
+    """Memoize LinearIssueParser.extract_linear_issue for the test session.
+    
+    Parsing is deterministic and the same event texts recur across tests.
+    The module-level function is wrapped directly so the cache holds no
+    reference to a per-session closure.
+    """
+    try:
+        from shared.utils.issue_parser import LinearIssueParser
+    except ImportError:
+        # src isn't importable for this run (e.g. only scripts/ collected)
+        yield
+        return
+    
+    original = LinearIssueParser.__dict__["extract_linear_issue"]
+    LinearIssueParser.extract_linear_issue = staticmethod(
+        functools.lru_cache(maxsize=256)(original.__func__)
+    )
+    yield
+    LinearIssueParser.extract_linear_issue = original
+
+
+@pytest.fixture(scope="session")
 def sample_slack_workspace_id():
     """Provide sample Slack workspace ID."""
     return SAMPLE_SLACK_IDS["workspace"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_slack_channel_ids():
     """Provide sample Slack channel IDs."""
-    return SAMPLE_SLACK_IDS["channels"]
+    return _ro(SAMPLE_SLACK_IDS["channels"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_slack_user_ids():
     """Provide sample Slack user IDs."""
-    return SAMPLE_SLACK_IDS["users"]
+    return _ro(SAMPLE_SLACK_IDS["users"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_slack_bot_ids():
     """Provide sample Slack bot IDs."""
-    return SAMPLE_SLACK_IDS["bots"]
+    return _ro(SAMPLE_SLACK_IDS["bots"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_linear_issues():
     """Provide sample Linear issue data."""
-    return SAMPLE_LINEAR_ISSUES
+    return _ro(SAMPLE_LINEAR_ISSUES)
 
 
 @pytest.fixture
 def slack_app_mention_event():
     """Provide sample Slack app mention event."""
-    return {
-        "type": "app_mention",
-        "user": SAMPLE_SLACK_IDS["users"]["alice"],
-        "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer implement user auth {SAMPLE_LINEAR_ISSUES['feature_request']['url']}",
-        "ts": "1234567890.123456",
-        "channel": SAMPLE_SLACK_IDS["channels"]["general"],
-        "thread_ts": None,
-        "event_ts": "1234567890.123456"
-    }
+    return _ro(_EVENT_APP_MENTION)
 
 
 @pytest.fixture
 def slack_threaded_mention_event():
     """Provide sample Slack app mention event in a thread."""
-    return {
-        "type": "app_mention",
-        "user": SAMPLE_SLACK_IDS["users"]["bob"],
-        "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> tester add tests for {SAMPLE_LINEAR_ISSUES['test_task']['url']}",
-        "ts": "1234567891.123456",
-        "channel": SAMPLE_SLACK_IDS["channels"]["dev-team"],
-        "thread_ts": "1234567890.000000",  # Original thread timestamp
-        "event_ts": "1234567891.123456"
-    }
+    return _ro(_EVENT_THREADED)
 
 
 @pytest.fixture
 def slack_ambiguous_mention_event():
     """Provide sample Slack mention without clear agent type."""
-    return {
-        "type": "app_mention",
-        "user": SAMPLE_SLACK_IDS["users"]["charlie"],
-        "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> please help with {SAMPLE_LINEAR_ISSUES['bug_report']['url']}",
-        "ts": "1234567892.123456", 
-        "channel": SAMPLE_SLACK_IDS["channels"]["qa-team"],
-        "event_ts": "1234567892.123456"
-    }
+    return _ro(_EVENT_AMBIGUOUS)
 
 
 @pytest.fixture
 def slack_mention_without_linear_url():
     """Provide sample Slack mention without Linear issue URL."""
-    return {
-        "type": "app_mention",
-        "user": SAMPLE_SLACK_IDS["users"]["alice"],
-        "text": f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer implement something",
-        "ts": "1234567893.123456",
-        "channel": SAMPLE_SLACK_IDS["channels"]["general"],
-        "event_ts": "1234567893.123456"
-    }
+    return _ro(_EVENT_NO_URL)
 
 
 @pytest.fixture
 def slack_config_complete():
-    """Provide complete Slack-enabled configuration."""
-    return [
-        {
-            "linearProjectId": "61c8a2f4-8b74-4f5c-9b3e-2a1d5e7f8c9d",
-            "projectName": "Multi-Agent TDD System - Core Engine",
-            "repoPath": "/home/test/projects/ClaudeCode_MultiAgentTDDEngine",
-            "slackChannelId": SAMPLE_SLACK_IDS["channels"]["general"],
-            "slackWorkspaceId": SAMPLE_SLACK_IDS["workspace"],
-            "agents": [
-                {
-                    "mention": "@developer",
-                    "slackBotId": SAMPLE_SLACK_IDS["bots"]["developer_agent"],
-                    "role": "Senior Python Developer specializing in clean architecture and FastAPI development",
-                    "testCommand": "pytest tests/ -v --cov=src --cov-report=term-missing"
-                },
-                {
-                    "mention": "@tester",
-                    "slackBotId": SAMPLE_SLACK_IDS["bots"]["tester_agent"],
-                    "role": "Software Quality Engineer specializing in TDD and comprehensive test coverage",
-                    "testCommand": "pytest tests/ -v --tb=short"
-                },
-                {
-                    "mention": "@reviewer",
-                    "slackBotId": SAMPLE_SLACK_IDS["bots"]["reviewer_agent"],
-                    "role": "Software Architect specializing in clean architecture and system design",
-                    "testCommand": "pytest tests/integration/ -v"
-                }
-            ]
+    """Provide complete Slack-enabled configuration (shared; do not mutate)."""
+    return _CONFIG_COMPLETE
+
+
+@pytest.fixture(scope="session")
+def slack_config_complete_indexed():
+    """Provide the complete configuration with agents indexed by type per project."""
+    index = {
+        project["linearProjectId"]: {
+            agent["mention"].lstrip("@"): agent for agent in project["agents"]
         }
-    ]
+        for project in _CONFIG_COMPLETE
+    }
+    return _CONFIG_COMPLETE, index
 
 
 @pytest.fixture
 def slack_config_legacy():
-    """Provide legacy configuration without Slack fields."""
-    return [
-        {
-            "linearProjectId": "legacy-project-id",
-            "projectName": "Legacy Project",
-            "repoPath": "/path/to/legacy/project",
-            "agents": [
-                {
-                    "mention": "@developer",
-                    "role": "Senior Developer",
-                    "testCommand": "pytest"
-                },
-                {
-                    "mention": "@tester",
-                    "role": "QA Engineer", 
-                    "testCommand": "pytest tests/"
-                }
-            ]
-        }
-    ]
+    """Provide legacy configuration without Slack fields (shared; do not mutate)."""
+    return _CONFIG_LEGACY
 
 
 @pytest.fixture
 def slack_config_partial():
-    """Provide configuration with partial Slack integration."""
-    return [
-        {
-            "linearProjectId": "partial-project-id",
-            "projectName": "Partially Migrated Project",
-            "repoPath": "/path/to/partial/project",
-            "slackChannelId": SAMPLE_SLACK_IDS["channels"]["dev-team"],
-            # Missing slackWorkspaceId
-            "agents": [
-                {
-                    "mention": "@developer",
-                    "slackBotId": SAMPLE_SLACK_IDS["bots"]["developer_agent"],
-                    "role": "Senior Developer",
-                    "testCommand": "pytest"
-                },
-                {
-                    "mention": "@tester",
-                    # Missing slackBotId
-                    "role": "QA Engineer",
-                    "testCommand": "pytest tests/"
-                }
-            ]
-        }
-    ]
+    """Provide configuration with partial Slack integration (shared; do not mutate)."""
+    return _CONFIG_PARTIAL
 
 
 @pytest.fixture
 def mock_slack_api_responses():
-    """Provide mock Slack API responses."""
-    return {
-        "chat_postMessage_success": {
-            "ok": True,
-            "channel": SAMPLE_SLACK_IDS["channels"]["general"],
-            "ts": "1234567890.123456",
-            "message": {
-                "type": "message",
-                "subtype": "bot_message",
-                "text": "Hello from bot!",
-                "ts": "1234567890.123456",
-                "username": "TDD Bot",
-                "bot_id": SAMPLE_SLACK_IDS["bots"]["tdd_bot"]
-            }
-        },
-        "chat_postMessage_error": {
-            "ok": False,
-            "error": "channel_not_found"
-        },
-        "files_upload_success": {
-            "ok": True,
-            "file": {
-                "id": "F1234567890",
-                "name": "test_report.pdf",
-                "title": "Test Report",
-                "mimetype": "application/pdf",
-                "filetype": "pdf",
-                "url_private": "https://files.slack.com/files-pri/T123/F123/test_report.pdf"
-            }
-        },
-        "users_info_success": {
-            "ok": True,
-            "user": {
-                "id": SAMPLE_SLACK_IDS["users"]["alice"],
-                "name": "alice.developer",
-                "real_name": "Alice Developer",
-                "email": "alice@company.com",
-                "is_bot": False,
-                "is_admin": False,
-                "profile": {
-                    "display_name": "Alice D.",
-                    "status_text": "Building great software",
-                    "status_emoji": ":computer:"
-                }
-            }
-        },
-        "reactions_add_success": {
-            "ok": True
-        },
-        "reactions_add_already_reacted": {
-            "ok": False,
-            "error": "already_reacted"
+    """Provide mock Slack API responses (read-only)."""
+    return _ro(_API_RESPONSES)
+
+
+class _StubSlackClient:
+    """Lightweight SlackClient stand-in whose calls always succeed."""
+    
+    def send_message(self, *args, **kwargs) -> bool:
+        return True
+    
+    def send_file(self, *args, **kwargs) -> bool:
+        return True
+    
+    def add_reaction(self, *args, **kwargs) -> bool:
+        return True
+    
+    def get_user_info(self, *args, **kwargs) -> Dict[str, Any]:
+        return {
+            "id": SAMPLE_SLACK_IDS["users"]["alice"],
+            "name": "alice.developer",
+            "real_name": "Alice Developer"
         }
-    }
+
+
+def _ok_response(*args, **kwargs) -> Dict[str, Any]:
+    return {"ok": True}
 
 
 @pytest.fixture
 def mock_slack_client():
-    """Provide mock SlackClient instance."""
-    mock_client = Mock()
-    
-    # Configure default successful responses
-    mock_client.send_message.return_value = True
-    mock_client.send_file.return_value = True
-    mock_client.add_reaction.return_value = True
-    mock_client.get_user_info.return_value = {
-        "id": SAMPLE_SLACK_IDS["users"]["alice"],
-        "name": "alice.developer",
-        "real_name": "Alice Developer"
-    }
-    
-    return mock_client
+    """Provide stub SlackClient instance."""
+    return _StubSlackClient()
 
 
 @pytest.fixture
 def mock_slack_web_client():
-    """Provide mock Slack WebClient instance."""
-    mock_web_client = Mock()
-    
-    # Configure API method responses
-    mock_web_client.chat_postMessage.return_value = {"ok": True}
-    mock_web_client.files_upload.return_value = {"ok": True}
-    mock_web_client.users_info.return_value = {
-        "ok": True,
-        "user": {"id": "U123", "name": "testuser"}
-    }
-    mock_web_client.reactions_add.return_value = {"ok": True}
-    
-    return mock_web_client
+    """Provide stub Slack WebClient instance."""
+    return SimpleNamespace(
+        chat_postMessage=_ok_response,
+        files_upload=_ok_response,
+        users_info=lambda *args, **kwargs: {
+            "ok": True,
+            "user": {"id": "U123", "name": "testuser"}
+        },
+        reactions_add=_ok_response
+    )
 
 
 @pytest.fixture
 def mock_linear_issue_parser():
-    """Provide mock LinearIssueParser instance."""
-    mock_parser = Mock()
-    
-    # Configure default parsing responses
-    mock_parser.extract_linear_issue.return_value = (
-        SAMPLE_LINEAR_ISSUES["feature_request"]["id"],
-        SAMPLE_LINEAR_ISSUES["feature_request"]["url"]
+    """Provide stub LinearIssueParser instance."""
+    feature_request = SAMPLE_LINEAR_ISSUES["feature_request"]
+    return SimpleNamespace(
+        extract_linear_issue=lambda text: (feature_request["id"], feature_request["url"]),
+        validate_issue_id=lambda issue_id: True
     )
-    mock_parser.validate_issue_id.return_value = True
-    
-    return mock_parser
 
 
 @pytest.fixture
 def mock_agent_dispatcher():
-    """Provide mock AgentDispatcher instance.""" 
-    mock_dispatcher = Mock()
-    
-    # Configure default successful dispatch
-    mock_dispatcher.dispatch_agent_task_with_callback.return_value = True
-    
-    return mock_dispatcher
+    """Provide stub AgentDispatcher instance."""
+    return SimpleNamespace(
+        dispatch_agent_task_with_callback=lambda *args, **kwargs: True
+    )
 
 
 @pytest.fixture
 def slack_progress_callback_context():
-    """Provide sample progress callback context."""
-    return {
-        "channel": SAMPLE_SLACK_IDS["channels"]["general"],
-        "thread_ts": "1234567890.123456",
-        "user": SAMPLE_SLACK_IDS["users"]["alice"]
-    }
+    """Provide sample progress callback context (read-only)."""
+    return _ro(_PROGRESS_CALLBACK_CONTEXT)
 
 
 @pytest.fixture
 def slack_bot_app_instance():
-    """Provide mock Slack Bolt App instance."""
-    mock_app = Mock()
-    mock_app.client = Mock()
-    
-    # Configure client methods
-    mock_app.client.chat_postMessage.return_value = {"ok": True}
-    mock_app.client.reactions_add.return_value = {"ok": True}
-    
-    return mock_app
+    """Provide stub Slack Bolt App instance."""
+    return SimpleNamespace(
+        client=SimpleNamespace(
+            chat_postMessage=_ok_response,
+            reactions_add=_ok_response
+        )
+    )
 
 
 class SlackEventBuilder:
     """Builder class for creating Slack event payloads."""
     
+    __slots__ = ("ts", "user", "channel", "text", "thread_ts")
+    
     def __init__(self):
-        self.event = {
-            "type": "app_mention",
-            "ts": str(int(time.time())) + ".123456",
-            "event_ts": str(int(time.time())) + ".123456"
-        }
+        self.ts = f"{time.time_ns() // 1_000_000_000}.123456"
+        self.user: Optional[str] = None
+        self.channel: Optional[str] = None
+        self.text: Optional[str] = None
+        self.thread_ts: Optional[str] = None
     
     def with_user(self, user_id: str):
         """Set the user ID for the event."""
-        self.event["user"] = user_id
+        self.user = user_id
         return self
     
     def with_channel(self, channel_id: str):
         """Set the channel ID for the event."""
-        self.event["channel"] = channel_id
+        self.channel = channel_id
         return self
     
     def with_text(self, text: str):
         """Set the text content for the event."""
-        self.event["text"] = text
+        self.text = text
         return self
     
     def with_thread(self, thread_ts: str):
         """Set the thread timestamp for the event."""
-        self.event["thread_ts"] = thread_ts
+        self.thread_ts = thread_ts
         return self
     
     def with_bot_mention(self, bot_id: str, agent_type: str, linear_url: str):
         """Add bot mention with agent type and Linear URL."""
-        self.event["text"] = f"<@{bot_id}> {agent_type} {linear_url}"
+        self.text = f"<@{bot_id}> {agent_type} {linear_url}"
         return self
     
     def build(self) -> Dict[str, Any]:
         """Build and return the event dictionary."""
-        return self.event.copy()
+        event = {"type": "app_mention", "ts": self.ts, "event_ts": self.ts}
+        for name in ("user", "channel", "text", "thread_ts"):
+            value = getattr(self, name)
+            if value is not None:
+                event[name] = value
+        return event
 
 
 @pytest.fixture
@@ -420,40 +494,59 @@ def slack_event_builder():
 class SlackApiResponseBuilder:
     """Builder class for creating mock Slack API responses."""
     
+    __slots__ = ("error", "channel", "ts", "user", "retry_after")
+    
     def __init__(self):
-        self.response = {"ok": True}
+        self.error: Optional[str] = None
+        self.channel: Optional[str] = None
+        self.ts: Optional[str] = None
+        self.user: Optional[Dict[str, Any]] = None
+        self.retry_after: Optional[int] = None
     
     def with_error(self, error_code: str):
         """Set error response."""
-        self.response = {"ok": False, "error": error_code}
+        # An error replaces anything configured so far
+        self.channel = self.ts = self.user = self.retry_after = None
+        self.error = error_code
         return self
     
     def with_message_response(self, channel: str, ts: str):
         """Set successful message response."""
-        self.response.update({
-            "channel": channel,
-            "ts": ts,
-            "message": {
-                "type": "message",
-                "text": "Response text",
-                "ts": ts
-            }
-        })
+        self.channel = channel
+        self.ts = ts
         return self
     
     def with_user_info(self, user_data: Dict[str, Any]):
         """Set user info response."""
-        self.response["user"] = user_data
+        self.user = user_data
         return self
     
     def with_rate_limit_headers(self, retry_after: int):
         """Add rate limiting headers."""
-        self.response["headers"] = {"Retry-After": str(retry_after)}
+        self.retry_after = retry_after
         return self
     
     def build(self) -> Dict[str, Any]:
         """Build and return the response dictionary."""
-        return self.response.copy()
+        if self.error is not None:
+            response: Dict[str, Any] = {"ok": False, "error": self.error}
+        else:
+            response = {"ok": True}
+        if self.ts is not None:
+            response.update({
+                "channel": self.channel,
+                "ts": self.ts,
+                "message": {
+                    "type": "message",
+                    "text": "Response text",
+                    "ts": self.ts
+                }
+            })
+        if self.user is not None:
+            response["user"] = self.user
+        if self.retry_after is not None:
+            response["headers"] = {"Retry-After": str(self.retry_after)}
+        return response
 
 
 @pytest.fixture
@@ -462,18 +555,20 @@ def slack_api_response_builder():
     return SlackApiResponseBuilder
 
 
+@functools.lru_cache(maxsize=16)
+def _hmac_template(secret_bytes: bytes) -> hmac.HMAC:
+    """Return an HMAC-SHA256 keyed with the secret; callers must copy() it."""
+    # hashlib.sha256 is OpenSSL's constructor, so hmac.new takes its native
+    # HMAC path (SHA-NI where available); a wrapped hashlib.new(...,
+    # usedforsecurity=False) would fall back to the pure-Python HMAC.
+    return hmac.new(secret_bytes, b"", hashlib.sha256)
+
+
 def create_slack_signature(signing_secret: str, timestamp: str, body: str) -> str:
     """Create valid Slack request signature for testing."""
-    import hashlib
-    import hmac
-    
-    basestring = f"v0:{timestamp}:{body}"
-    signature = hmac.new(
-        signing_secret.encode(),
-        basestring.encode(),
-        hashlib.sha256
-    ).hexdigest()
-    return f"v0={signature}"
+    signature = _hmac_template(signing_secret.encode()).copy()
+    signature.update(f"v0:{timestamp}:{body}".encode())
+    return f"v0={signature.hexdigest()}"
 
 
 @pytest.fixture
@@ -482,39 +577,48 @@ def slack_signature_helper():
     return create_slack_signature
 
 
+_LINEAR_TEST_ISSUE_BASE = "https://linear.app/testteam/issue"
+
+
 def generate_test_linear_issues(count: int) -> List[Dict[str, str]]:
     """Generate multiple test Linear issues."""
-    issues = []
-    for i in range(count):
-        issue = {
-            "id": f"TEST-{i+1:03d}",
-            "url": f"https://linear.app/testteam/issue/TEST-{i+1:03d}",
-            "title": f"Test Issue {i+1}",
-            "description": f"Description for test issue number {i+1}"
+    return [
+        {
+            "id": (issue_id := f"TEST-{i:03d}"),
+            "url": f"{_LINEAR_TEST_ISSUE_BASE}/{issue_id}",
+            "title": f"Test Issue {i}",
+            "description": f"Description for test issue number {i}"
         }
-        issues.append(issue)
-    return issues
+        for i in range(1, count + 1)
+    ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_linear_issues():
     """Provide multiple test Linear issues."""
     return generate_test_linear_issues(10)
 
 
+_LARGE_EVENT_PREFIX = f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer "
+_LARGE_EVENT_SUFFIX = f" {SAMPLE_LINEAR_ISSUES['feature_request']['url']}"
+_LARGE_EVENT_TEMPLATE = {
+    "type": "app_mention",
+    "user": SAMPLE_SLACK_IDS["users"]["alice"],
+    "ts": "1234567890.123456",
+    "channel": SAMPLE_SLACK_IDS["channels"]["general"],
+    "event_ts": "1234567890.123456"
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _large_event_text(text_size: int) -> str:
+    """Build (once per size) the padded mention text for large events."""
+    return _LARGE_EVENT_PREFIX + "x" * text_size + _LARGE_EVENT_SUFFIX
+
+
 def create_large_slack_event(text_size: int = 1000) -> Dict[str, Any]:
     """Create Slack event with large text payload."""
-    large_text = f"<@{SAMPLE_SLACK_IDS['bots']['tdd_bot']}> developer " + "x" * text_size
-    large_text += f" {SAMPLE_LINEAR_ISSUES['feature_request']['url']}"
-    
-    return {
-        "type": "app_mention",
-        "user": SAMPLE_SLACK_IDS["users"]["alice"],
-        "text": large_text,
-        "ts": "1234567890.123456",
-        "channel": SAMPLE_SLACK_IDS["channels"]["general"],
-        "event_ts": "1234567890.123456"
-    }
+    return {**_LARGE_EVENT_TEMPLATE, "text": _large_event_text(text_size)}
 
 
 @pytest.fixture
@@ -526,47 +630,35 @@ def large_slack_event():
 # Utility functions for test data manipulation
 def with_slack_fields_added(legacy_config: List[Dict]) -> List[Dict]:
     """Add Slack fields to legacy configuration."""
-    updated_config = []
-    
-    for i, project in enumerate(legacy_config):
-        updated_project = project.copy()
-        updated_project["slackChannelId"] = f"C123456789{i}"
-        updated_project["slackWorkspaceId"] = SAMPLE_SLACK_IDS["workspace"]
-        
-        updated_agents = []
-        for j, agent in enumerate(updated_project.get("agents", [])):
-            updated_agent = agent.copy()
-            updated_agent["slackBotId"] = f"U{i}{j}23456789"
-            updated_agents.append(updated_agent)
-        
-        updated_project["agents"] = updated_agents
-        updated_config.append(updated_project)
-    
-    return updated_config
+    return [
+        {
+            **project,
+            "slackChannelId": f"C123456789{i}",
+            "slackWorkspaceId": SAMPLE_SLACK_IDS["workspace"],
+            "agents": [
+                {**agent, "slackBotId": f"U{i}{j}23456789"}
+                for j, agent in enumerate(project.get("agents", []))
+            ]
+        }
+        for i, project in enumerate(legacy_config)
+    ]
+
+
+_SLACK_PROJECT_FIELDS = frozenset({"slackChannelId", "slackWorkspaceId"})
 
 
 def without_slack_fields(slack_config: List[Dict]) -> List[Dict]:
     """Remove Slack fields from configuration."""
-    legacy_config = []
-    
-    for project in slack_config:
-        legacy_project = project.copy()
-        
-        # Remove Slack project fields
-        legacy_project.pop("slackChannelId", None)
-        legacy_project.pop("slackWorkspaceId", None)
-        
-        # Remove Slack agent fields
-        legacy_agents = []
-        for agent in legacy_project.get("agents", []):
-            legacy_agent = agent.copy()
-            legacy_agent.pop("slackBotId", None)
-            legacy_agents.append(legacy_agent)
-        
-        legacy_project["agents"] = legacy_agents
-        legacy_config.append(legacy_project)
-    
-    return legacy_config
+    return [
+        {
+            **{k: v for k, v in project.items() if k not in _SLACK_PROJECT_FIELDS},
+            "agents": [
+                {k: v for k, v in agent.items() if k != "slackBotId"}
+                for agent in project.get("agents", [])
+            ]
+        }
+        for project in slack_config
+    ]
 
 
 @pytest.fixture
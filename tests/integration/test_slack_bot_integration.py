@@ -7,28 +7,78 @@ Tests the end-to-end integration of all Slack components working together.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import json
-import tempfile
-import os
 
 from shared.utils.issue_parser import LinearIssueParser
 from infrastructure.external.slack_client import SlackClient
 from agent_engine import AgentDispatcher
+from presentation.api import slack_bot
+from presentation.api.slack_bot import (
+    _determine_agent_type,
+    _extract_task_description,
+    _find_agent_by_type,
+    _parse_mention,
+    _slack_progress_callback
+)
+
+
+# Sample configuration, serialized once at import
+_TEST_CONFIG = [
+    {
+        "linearProjectId": "test-project-123",
+        "projectName": "Test Project",
+        "repoPath": "/tmp/test",
+        "slackChannelId": "C123456",
+        "agents": [
+            {
+                "mention": "@developer",
+                "slackBotId": "U123456",
+                "role": "Developer",
+                "testCommand": "pytest"
+            }
+        ]
+    }
+]
+_TEST_CONFIG_JSON = json.dumps(_TEST_CONFIG)
 
 
 class TestSlackBotWorkflowIntegration:
     """Test complete Slack bot workflow integration."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.issue_parser = LinearIssueParser()
+    @pytest.fixture(scope="class")
+    def issue_parser(self):
+        """Provide a LinearIssueParser shared by the tests in this class."""
+        return LinearIssueParser()
+    
+    @pytest.fixture(scope="class")
+    def agent_dispatcher(self):
+        """Provide an AgentDispatcher shared by the tests in this class."""
+        return AgentDispatcher()
+    
+    @pytest.fixture
+    def fake_popen(self, monkeypatch):
+        """Replace agent_engine's Popen with a Mock for the duration of a test."""
+        mock_popen = Mock()
+        monkeypatch.setattr("agent_engine.subprocess.Popen", mock_popen)
+        return mock_popen
+    
+    @pytest.fixture(autouse=True)
+    def clear_config_cache(self):
+        """Keep the module-level config cache from leaking between tests."""
+        def reset():
+            slack_bot._clear_config_cache()
+            slack_bot._CONFIG_CACHE.update(data=None, agents_by_type={})
         
-        # Mock Slack client
+        reset()
+        yield
+        reset()
+    
+    @pytest.fixture(scope="class")
+    def slack_client(self):
+        """Provide a SlackClient built with a test token, shared by the class."""
         with patch.dict('os.environ', {'SLACK_BOT_TOKEN': 'test-token'}):
-            self.slack_client = SlackClient()
-        
-        self.agent_dispatcher = AgentDispatcher()
+            return SlackClient()
     
-    def test_complete_workflow_success(self):
+    def test_complete_workflow_success(self, issue_parser, agent_dispatcher, fake_popen):
         """Test complete successful workflow from Slack mention to agent dispatch."""
         # Sample Slack event
         slack_event = {
@@ -56,23 +106,20 @@ class TestSlackBotWorkflowIntegration:
         
         # Test issue parsing
         text = slack_event["text"]
-        issue_id, issue_url = self.issue_parser.extract_linear_issue(text)
+        issue_id, issue_url = issue_parser.extract_linear_issue(text)
         
         assert issue_id == "ABC-123"
         assert issue_url == "https://linear.app/myteam/issue/ABC-123"
         
         # Test agent type determination
-        from presentation.api.slack_bot import _determine_agent_type
         agent_type = _determine_agent_type(text)
         assert agent_type == "developer"
         
         # Test task description extraction
-        from presentation.api.slack_bot import _extract_task_description
         task_description = _extract_task_description(text, issue_url)
         assert "user authentication" in task_description
         
         # Test agent finding
-        from presentation.api.slack_bot import _find_agent_by_type
         agent = _find_agent_by_type(project_config, agent_type)
         assert agent is not None
         assert agent["mention"] == "@developer"
@@ -88,54 +135,69 @@ class TestSlackBotWorkflowIntegration:
         def mock_callback(context, status, message):
             callback_called.append((context, status, message))
         
-        with patch('agent_engine.subprocess.Popen') as mock_popen:
-            mock_process = Mock()
-            mock_popen.return_value = mock_process
-            
-            success = self.agent_dispatcher.dispatch_agent_task_with_callback(
-                project=project_config,
-                agent=agent,
-                issue_id=issue_id,
-                comment_body=task_description,
-                callback_context=slack_context,
-                callback_func=mock_callback
-            )
+        success = agent_dispatcher.dispatch_agent_task_with_callback(
+            project=project_config,
+            agent=agent,
+            issue_id=issue_id,
+            comment_body=task_description,
+            callback_context=slack_context,
+            callback_func=mock_callback
+        )
         
         assert success is True
         assert len(callback_called) > 0
         assert callback_called[0][1] == 'started'
     
-    def test_issue_parser_integration_with_slack_client(self):
+    # Various message formats that might come from Slack
+    @pytest.mark.parametrize("message, expected_id, expected_url", [
+        ("Check out https://linear.app/team/issue/ABC-123 for the bug report",
+         "ABC-123", "https://linear.app/team/issue/ABC-123"),
+        ("<@U123456> developer please work on ABC-456", "ABC-456", None),
+        ("Linear issue: https://linear.app/my-team/issue/PROJ-789 needs attention",
+         "PROJ-789", "https://linear.app/my-team/issue/PROJ-789"),
+        ("Working on DEF-123 today", "DEF-123", None),
+    ])
+    def test_issue_parser_integration_with_slack_client(
+        self, issue_parser, message, expected_id, expected_url
+    ):
         """Test issue parser integration with Slack client operations."""
-        # Test various message formats that might come from Slack
-        test_messages = [
-            "Check out https://linear.app/team/issue/ABC-123 for the bug report",
-            "<@U123456> developer please work on ABC-456",
-            "Linear issue: https://linear.app/my-team/issue/PROJ-789 needs attention",
-            "Working on DEF-123 today",
-        ]
-        
-        expected_results = [
-            ("ABC-123", "https://linear.app/team/issue/ABC-123"),
-            ("ABC-456", None),
-            ("PROJ-789", "https://linear.app/my-team/issue/PROJ-789"),
-            ("DEF-123", None)
-        ]
+        issue_id, url = issue_parser.extract_linear_issue(message)
+        assert issue_id == expected_id
+        assert url == expected_url
+    
+    @pytest.mark.parametrize("message, expected_id, expected_reference, expected_type", [
+        ("<@U123456> developer https://linear.app/team/issue/ABC-123",
+         "ABC-123", "https://linear.app/team/issue/ABC-123", "developer"),
+        ("<@U123456> tester please check DEF-456", "DEF-456", "DEF-456", "tester"),
+        ("<@U123456> please help with GHI-789", "GHI-789", "GHI-789", None),
+        ("<@U123456> developer please help", None, None, None),
+    ])
+    def test_parse_mention_matches_individual_helpers(
+        self, message, expected_id, expected_reference, expected_type
+    ):
+        """Test the one-shot mention parse agrees with the individual helpers."""
+        mention = _parse_mention(message)
+        assert mention.text == message
+        assert mention.issue_id == expected_id
+        assert mention.issue_reference == expected_reference
+        assert mention.agent_type == expected_type
+    
+    def test_find_agent_by_type_matches_index(self, slack_config_complete_indexed):
+        """Test agent lookup by type agrees with the pre-indexed configuration."""
+        config, index = slack_config_complete_indexed
+        project = config[0]
+        agents = index[project["linearProjectId"]]
         
-        for message, expected in zip(test_messages, expected_results):
-            issue_id, url = self.issue_parser.extract_linear_issue(message)
-            assert issue_id == expected[0]
-            assert url == expected[1]
+        for agent_type in ("developer", "tester"):
+            assert _find_agent_by_type(project, agent_type) is agents[agent_type]
     
-    def test_slack_client_integration_with_callbacks(self):
+    def test_slack_client_integration_with_callbacks(self, slack_client):
         """Test Slack client integration with progress callbacks."""
         # Mock the Slack API client
-        with patch.object(self.slack_client, 'client') as mock_client:
+        with patch.object(slack_client, 'client') as mock_client:
             mock_client.chat_postMessage.return_value = {"ok": True}
             
             # Test progress callback functionality
-            from presentation.api.slack_bot import _slack_progress_callback
-            
             context = {
                 "channel": "C1234567890",
                 "thread_ts": "1234567890.123456",
@@ -146,7 +208,7 @@ class TestSlackBotWorkflowIntegration:
             with patch('presentation.api.slack_bot.app') as mock_app:
                 mock_app.client = mock_client
                 
-                _slack_progress_callback(context, "success", "Task completed successfully")
+                _slack_progress_callback(context, "success", "Task completed successfully").result()
                 
                 mock_client.chat_postMessage.assert_called_once_with(
                     channel="C1234567890",
@@ -154,7 +216,7 @@ class TestSlackBotWorkflowIntegration:
                     text="✅ Task completed successfully"
                 )
     
-    def test_error_handling_throughout_workflow(self):
+    def test_error_handling_throughout_workflow(self, issue_parser, agent_dispatcher, fake_popen):
         """Test error handling at various points in the workflow."""
         # Test with malformed Slack event
         malformed_event = {
@@ -164,7 +226,7 @@ class TestSlackBotWorkflowIntegration:
         }
         
         text = malformed_event["text"]
-        issue_id, issue_url = self.issue_parser.extract_linear_issue(text)
+        issue_id, issue_url = issue_parser.extract_linear_issue(text)
         
         # Should handle gracefully
         assert issue_id is None
@@ -178,96 +240,98 @@ class TestSlackBotWorkflowIntegration:
             if status == 'failed':
                 callback_errors.append(message)
         
-        with patch('agent_engine.subprocess.Popen') as mock_popen:
-            mock_popen.side_effect = Exception("Process failed")
-            
-            success = self.agent_dispatcher.dispatch_agent_task_with_callback(
-                project=invalid_project,
-                agent={"role": "Test", "testCommand": "test"},
-                issue_id="TEST-123",
-                comment_body="Test task",
-                callback_context={"test": "context"},
-                callback_func=error_callback
-            )
+        fake_popen.side_effect = Exception("Process failed")
+        
+        success = agent_dispatcher.dispatch_agent_task_with_callback(
+            project=invalid_project,
+            agent={"role": "Test", "testCommand": "test"},
+            issue_id="TEST-123",
+            comment_body="Test task",
+            callback_context={"test": "context"},
+            callback_func=error_callback
+        )
         
         assert success is False
         assert len(callback_errors) > 0
     
-    def test_configuration_loading_integration(self):
+    def test_configuration_loading_integration(self, tmp_path):
         """Test configuration loading integration with project lookup."""
         # Create temporary config file
-        config_data = [
-            {
-                "linearProjectId": "test-project-123",
-                "projectName": "Test Project",
-                "repoPath": "/tmp/test",
-                "slackChannelId": "C123456",
-                "agents": [
-                    {
-                        "mention": "@developer",
-                        "slackBotId": "U123456",
-                        "role": "Developer",
-                        "testCommand": "pytest"
-                    }
-                ]
-            }
-        ]
+        (tmp_path / "config.json").write_text(_TEST_CONFIG_JSON)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(config_data, temp_file)
-            temp_config_path = temp_file.name
+        # Test project lookup with temporary config
+        with patch.object(slack_bot, 'project_root', tmp_path):
+            project = slack_bot._get_project_from_issue("TEST-123")
         
-        try:
-            # Test project lookup with temporary config
-            from presentation.api.slack_bot import _get_project_from_issue
+        # Should return first project
+        assert project is not None
+        assert project["projectName"] == "Test Project"
+    
+    def test_project_lookup_falls_back_to_cached_config(self, tmp_path):
+        """Test project lookup serves the last good config when the file can't be read."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps([{"projectName": "Cached Project", "agents": []}]))
+        
+        with patch.object(slack_bot, 'project_root', tmp_path):
+            project = slack_bot._get_project_from_issue("ABC-123")
+            assert project["projectName"] == "Cached Project"
             
-            with patch('presentation.api.slack_bot.project_root') as mock_root:
-                mock_root.__truediv__ = lambda self, other: temp_config_path if other == "config.json" else None
-                
-                # Mock pathlib.Path behavior
-                with patch('pathlib.Path') as mock_path:
-                    mock_path.return_value.__truediv__.return_value = temp_config_path
-                    
-                    with patch('builtins.open', create=True) as mock_open:
-                        mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(config_data)
-                        
-                        project = _get_project_from_issue("TEST-123")
-                        
-                        # Should return first project
-                        assert project is not None
-                        assert project["projectName"] == "Test Project"
-        
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_config_path)
+            config_file.unlink()
+            project = slack_bot._get_project_from_issue("ABC-123")
+        
+        assert project is not None
+        assert project["projectName"] == "Cached Project"
     
-    def test_concurrent_slack_operations(self):
-        """Test handling of concurrent Slack operations."""
-        import threading
-        import time
+    def test_project_lookup_parses_config_once(self, tmp_path, thread_pool):
+        """Test concurrent lookups share one parse until the config is cleared."""
+        (tmp_path / "config.json").write_text(_TEST_CONFIG_JSON)
         
+        with patch.object(slack_bot, 'project_root', tmp_path), \
+             patch('presentation.api.slack_bot.json.load', wraps=json.load) as mock_load:
+            futures = [
+                thread_pool.submit(slack_bot._get_project_from_issue, f"TEST-{i}")
+                for i in range(10)
+            ]
+            projects = [future.result() for future in futures]
+            assert mock_load.call_count == 1
+            
+            slack_bot._clear_config_cache()
+            slack_bot._get_project_from_issue("TEST-1")
+            assert mock_load.call_count == 2
+        
+        assert all(project["projectName"] == "Test Project" for project in projects)
+    
+    def test_find_agent_by_type_uses_cached_index(self, tmp_path):
+        """Test agent lookup on a cached project and on a project built elsewhere."""
+        (tmp_path / "config.json").write_text(_TEST_CONFIG_JSON)
+        
+        with patch.object(slack_bot, 'project_root', tmp_path):
+            project = slack_bot._get_project_from_issue("TEST-123")
+        
+        agent = _find_agent_by_type(project, "developer")
+        assert agent is project["agents"][0]
+        assert _find_agent_by_type(project, "tester") is None
+        
+        uncached = json.loads(_TEST_CONFIG_JSON)[0]
+        assert _find_agent_by_type(uncached, "developer") == agent
+    
+    def test_concurrent_slack_operations(self, issue_parser, thread_pool):
+        """Test handling of concurrent Slack operations."""
         results = []
         errors = []
         
         def process_message(message_id):
             try:
                 text = f"<@U123> developer work on ABC-{message_id} https://linear.app/team/issue/ABC-{message_id}"
-                issue_id, url = self.issue_parser.extract_linear_issue(text)
+                issue_id, url = issue_parser.extract_linear_issue(text)
                 results.append((message_id, issue_id, url))
-                time.sleep(0.01)  # Simulate processing time
             except Exception as e:
                 errors.append((message_id, str(e)))
         
         # Process multiple messages concurrently
-        threads = []
-        for i in range(10):
-            thread = threading.Thread(target=process_message, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        futures = [thread_pool.submit(process_message, i) for i in range(10)]
+        for future in futures:
+            future.result()
         
         # Verify results
         assert len(errors) == 0
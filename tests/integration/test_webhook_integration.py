@@ -4,52 +4,67 @@ Integration tests for the webhook server and agent engine.
 These tests verify the end-to-end functionality of the Multi-Agent TDD system.
 """
 
-import json
+import copy
 import os
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
-# Add src to path for imports
-import sys
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+from webhook_server import app, AgentDispatcher, ConfigManager, PayloadParser, WebhookValidator
 
-from webhook_server import app, ConfigManager, PayloadParser, WebhookValidator
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI test client."""
-    return TestClient(app)
+    """FastAPI test client, started once for the module.
+    
+    Endpoint tests patch the server's globals per test, so sharing the client is safe.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+_SAMPLE_CONFIG = [
+    {
+        "linearProjectId": "test-project-123",
+        "projectName": "Test Project",
+        "repoPath": "/tmp/test-repo",
+        "agents": [
+            {
+                "mention": "@developer",
+                "role": "Senior Python Developer",
+                "testCommand": "pytest"
+            },
+            {
+                "mention": "@tester",
+                "role": "QA Engineer",
+                "testCommand": "pytest tests/"
+            }
+        ]
+    }
+]
 
 
 @pytest.fixture
 def sample_config():
-    """Sample configuration for testing."""
-    return [
-        {
-            "linearProjectId": "test-project-123",
-            "projectName": "Test Project",
-            "repoPath": "/tmp/test-repo",
-            "agents": [
-                {
-                    "mention": "@developer",
-                    "role": "Senior Python Developer",
-                    "testCommand": "pytest"
-                },
-                {
-                    "mention": "@tester",
-                    "role": "QA Engineer",
-                    "testCommand": "pytest tests/"
-                }
-            ]
-        }
-    ]
+    """Sample configuration for testing (a fresh copy tests may mutate)."""
+    return copy.deepcopy(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def config_manager(tmp_path_factory):
+    """ConfigManager over the sample configuration, written and loaded once per module.
+    
+    Read-only tests share it; tests that edit the config file build their own.
+    """
+    config_file = tmp_path_factory.mktemp("config") / "test_config.json"
+    config_file.write_bytes(orjson.dumps(_SAMPLE_CONFIG))
+    return ConfigManager(str(config_file))
 
 
 @pytest.fixture
@@ -81,39 +96,130 @@ def sample_linear_payload():
 class TestConfigManager:
     """Test the configuration manager."""
     
-    def test_load_config_success(self, sample_config, tmp_path):
+    def test_load_config_success(self, config_manager):
         """Test successful configuration loading."""
-        config_file = tmp_path / "test_config.json"
-        config_file.write_text(json.dumps(sample_config))
-        
-        manager = ConfigManager(str(config_file))
-        config = manager.load_config()
+        config = config_manager.load_config()
         
         assert len(config) == 1
         assert config[0]["projectName"] == "Test Project"
     
-    def test_find_project_by_id(self, sample_config, tmp_path):
+    def test_find_project_by_id(self, config_manager):
         """Test finding project by ID."""
+        project = config_manager.find_project_by_id("test-project-123")
+        
+        assert project is not None
+        assert project["projectName"] == "Test Project"
+    
+    def test_find_agent_by_mention(self, config_manager):
+        """Test finding agent by mention."""
+        project = config_manager.find_project_by_id("test-project-123")
+        agent = config_manager.find_agent_by_mention(project, "@developer")
+        
+        assert agent is not None
+        assert agent["role"] == "Senior Python Developer"
+        assert config_manager.find_agent_by_mention(project, "@unknown") is None
+    
+    def test_find_agent_by_mention_unindexed_project(self, config_manager, sample_config):
+        """Test agent lookup on a project dict that wasn't loaded from the config file."""
+        config_manager.load_config()
+        agent = config_manager.find_agent_by_mention(sample_config[0], "@tester")
+        
+        assert agent is not None
+        assert agent["role"] == "QA Engineer"
+    
+    def test_indexed_lookups_keep_first_duplicate(self, sample_config, tmp_path):
+        """Test duplicate project IDs and mentions resolve to the first entry, as a scan would."""
+        duplicate_project = {
+            **sample_config[0],
+            "projectName": "Shadowed Project",
+            "agents": [{"mention": "@developer", "role": "Shadowed Developer"}]
+        }
+        sample_config[0]["agents"].append({"mention": "@developer", "role": "Second Developer"})
         config_file = tmp_path / "test_config.json"
-        config_file.write_text(json.dumps(sample_config))
+        config_file.write_bytes(orjson.dumps(sample_config + [duplicate_project]))
         
         manager = ConfigManager(str(config_file))
         project = manager.find_project_by_id("test-project-123")
         
-        assert project is not None
         assert project["projectName"] == "Test Project"
+        assert manager.agents_by_mention(project) is manager.agents_by_mention(project)
+        assert manager.find_agent_by_mention(project, "@developer")["role"] == "Senior Python Developer"
+        # The cached index holds exactly what a scan of the kept project finds
+        assert manager.agents_by_mention(project) == {
+            "@developer": sample_config[0]["agents"][0],
+            "@tester": sample_config[0]["agents"][1]
+        }
     
-    def test_find_agent_by_mention(self, sample_config, tmp_path):
-        """Test finding agent by mention."""
+    def test_duplicate_project_ids_keep_agents_separate(self, sample_config, tmp_path):
+        """Test agents of a shadowed duplicate project don't leak into the kept project."""
+        duplicate_project = {
+            **sample_config[0],
+            "projectName": "Shadowed Project",
+            "repoPath": "/tmp/shadowed-repo",
+            "agents": [{"mention": "@architect", "role": "Shadowed Architect"}]
+        }
         config_file = tmp_path / "test_config.json"
-        config_file.write_text(json.dumps(sample_config))
+        config_file.write_bytes(orjson.dumps(sample_config + [duplicate_project]))
         
         manager = ConfigManager(str(config_file))
         project = manager.find_project_by_id("test-project-123")
-        agent = manager.find_agent_by_mention(project, "@developer")
         
-        assert agent is not None
-        assert agent["role"] == "Senior Python Developer"
+        assert set(manager.agents_by_mention(project)) == {"@developer", "@tester"}
+        assert manager.find_agent_by_mention(project, "@architect") is None
+    
+    def test_load_config_parses_once_while_unchanged(self, sample_config, tmp_path):
+        """Test repeated lookups are served from the cache without re-parsing."""
+        config_file = tmp_path / "test_config.json"
+        config_file.write_bytes(orjson.dumps(sample_config))
+        
+        manager = ConfigManager(str(config_file))
+        with patch('webhook_server.orjson.loads', wraps=orjson.loads) as mock_loads:
+            for _ in range(3):
+                assert manager.find_project_by_id("test-project-123") is not None
+        
+        mock_loads.assert_called_once()
+    
+    def test_load_config_reloads_when_file_changes(self, sample_config, tmp_path):
+        """Test the cached configuration is refreshed after the file is modified."""
+        config_file = tmp_path / "test_config.json"
+        config_file.write_bytes(orjson.dumps(sample_config))
+        
+        manager = ConfigManager(str(config_file))
+        assert manager.find_project_by_id("test-project-123") is not None
+        
+        sample_config[0]["linearProjectId"] = "renamed-project"
+        config_file.write_bytes(orjson.dumps(sample_config))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert manager.find_project_by_id("test-project-123") is None
+        assert manager.find_project_by_id("renamed-project")["projectName"] == "Test Project"
+    
+    def test_load_config_serves_cache_when_file_disappears(self, sample_config, tmp_path):
+        """Test a config file that vanishes after the first load falls back to the cache."""
+        config_file = tmp_path / "test_config.json"
+        config_file.write_bytes(orjson.dumps(sample_config))
+        
+        manager = ConfigManager(str(config_file))
+        config = manager.load_config()
+        config_file.unlink()
+        
+        with patch('webhook_server.logger') as mock_logger:
+            assert manager.load_config() is config
+            assert manager.find_project_by_id("test-project-123") is not None
+        
+        mock_logger.warning.assert_called()
+        mock_logger.error.assert_not_called()
+    
+    def test_load_config_missing_file_on_cold_cache(self, tmp_path):
+        """Test a missing config file is still an error before anything was loaded."""
+        manager = ConfigManager(str(tmp_path / "missing.json"))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.load_config()
+        
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "Configuration file not found"
 
 
 class TestPayloadParser:
@@ -162,6 +268,18 @@ class TestWebhookValidator:
         # Should return True when no secret is configured
         assert result is True
     
+    def test_validate_signature_no_secret_warns_once(self):
+        """Test the missing secret is logged at construction, not on every request."""
+        with patch.dict(os.environ, {}, clear=True), \
+             patch('webhook_server.logger') as mock_logger:
+            validator = WebhookValidator(webhook_secret=None)
+            for _ in range(3):
+                assert validator.validate_signature(b"test payload", None) is True
+        
+        mock_logger.warning.assert_called_once_with(
+            "No webhook secret configured - signature validation disabled"
+        )
+    
     def test_validate_signature_valid(self):
         """Test validation with valid signature."""
         import hmac
@@ -176,12 +294,66 @@ class TestWebhookValidator:
         
         assert result is True
     
+    def test_validate_signature_reuses_keyed_prototype(self):
+        """Test repeated validations don't consume the pre-keyed HMAC state."""
+        import hmac
+        import hashlib
+        
+        secret = "test-secret"
+        validator = WebhookValidator(webhook_secret=secret)
+        
+        for payload in (b"first payload", b"second payload", b"first payload"):
+            expected_sig = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+            assert validator.validate_signature(payload, f"sha256={expected_sig}") is True
+    
     def test_validate_signature_invalid(self):
         """Test validation with invalid signature."""
         validator = WebhookValidator(webhook_secret="test-secret")
         result = validator.validate_signature(b"test payload", "sha256=invalid")
         
         assert result is False
+    
+    def test_validate_signature_wrong_digest(self):
+        """Test validation with well-formed hex that doesn't match the payload."""
+        import hmac
+        import hashlib
+        
+        validator = WebhookValidator(webhook_secret="test-secret")
+        other_sig = hmac.new(b"other-secret", b"test payload", hashlib.sha256).hexdigest()
+        
+        assert validator.validate_signature(b"test payload", f"sha256={other_sig}") is False
+        assert validator.validate_signature(b"test payload", "sha256=abcd") is False
+
+
+class TestAgentDispatcher:
+    """Test the AgentDispatcher class."""
+    
+    def test_dispatch_detaches_child_output(self, sample_config):
+        """Test that the child is detached and its output is not piped back."""
+        dispatcher = AgentDispatcher()
+        project = sample_config[0]
+        
+        with patch('webhook_server.subprocess.Popen') as mock_popen:
+            mock_popen.return_value.pid = 1234
+            result = dispatcher.dispatch_agent_task(
+                project=project,
+                agent=project["agents"][0],
+                issue_id="issue-123",
+                comment_body="@backend-dev implement login"
+            )
+        
+        assert result is True
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.DEVNULL
+        assert kwargs["start_new_session"] is True
+        
+        # Absolute paths and no cwd/preexec_fn keep the spawn on the fast path
+        cmd = mock_popen.call_args.args[0]
+        assert Path(cmd[0]).is_absolute()
+        assert Path(cmd[1]).is_absolute()
+        assert "cwd" not in kwargs
+        assert "preexec_fn" not in kwargs
 
 
 class TestWebhookEndpoints:
@@ -214,7 +386,9 @@ class TestWebhookEndpoints:
         """Test successful webhook processing."""
         # Mock configuration
         mock_config.find_project_by_id.return_value = sample_config[0]
-        mock_config.find_agent_by_mention.return_value = sample_config[0]["agents"][0]
+        mock_config.agents_by_mention.return_value = {
+            "@developer": sample_config[0]["agents"][0]
+        }
         
         # Mock validation
         mock_validator.validate_signature.return_value = True
@@ -232,6 +406,45 @@ class TestWebhookEndpoints:
         data = response.json()
         assert data["dispatched"] is True
         assert "Successfully dispatched" in data["message"]
+        
+        # Dispatch runs as a background task once the response is ready
+        mock_dispatcher.dispatch_agent_task.assert_called_once_with(
+            project=sample_config[0],
+            agent=sample_config[0]["agents"][0],
+            issue_id="issue-123",
+            comment_body=sample_linear_payload["data"]["body"]
+        )
+    
+    @pytest.mark.parametrize("body, expected_message", [
+        ("Looks good to me", "No agent mentions found in comment"),
+        ("@designer can you take a look?", "No valid agent mentions found for this project"),
+    ])
+    def test_webhook_endpoint_without_known_mentions(
+        self, client, sample_linear_payload, sample_config, body, expected_message
+    ):
+        """Test comments with no mentions or only unknown mentions are not dispatched."""
+        sample_linear_payload["data"]["body"] = body
+        
+        with patch('webhook_server.config_manager') as mock_config, \
+             patch('webhook_server.webhook_validator') as mock_validator, \
+             patch('webhook_server.agent_dispatcher') as mock_dispatcher:
+            mock_config.find_project_by_id.return_value = sample_config[0]
+            mock_config.agents_by_mention.return_value = {
+                agent["mention"]: agent for agent in sample_config[0]["agents"]
+            }
+            mock_validator.validate_signature.return_value = True
+            
+            response = client.post(
+                "/webhook/linear",
+                json=sample_linear_payload,
+                headers={"Linear-Signature": "sha256=test"}
+            )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dispatched"] is False
+        assert data["message"] == expected_message
+        mock_dispatcher.dispatch_agent_task.assert_not_called()
     
     def test_webhook_endpoint_invalid_signature(self, client, sample_linear_payload):
         """Test webhook with invalid signature."""
@@ -255,7 +468,62 @@ class TestWebhookEndpoints:
         )
         
         assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid JSON payload"
+    
+    def test_webhook_endpoint_non_comment_event_skips_validation(self, client):
+        """Test non-comment events are acknowledged without building the payload model."""
+        issue_update = {"type": "Issue", "action": "update", "data": {"id": "issue-123"}}
+        
+        with patch('webhook_server.webhook_validator') as mock_validator, \
+             patch('webhook_server.LinearWebhookPayload') as mock_model:
+            mock_validator.validate_signature.return_value = True
+            
+            response = client.post(
+                "/webhook/linear",
+                json=issue_update,
+                headers={"Linear-Signature": "sha256=test"}
+            )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dispatched"] is False
+        assert data["message"] == "Webhook received but not a comment event"
+        mock_model.model_validate_json.assert_not_called()
+    
+    @patch('webhook_server.config_manager')
+    @patch('webhook_server.webhook_validator')
+    @patch('webhook_server.agent_dispatcher')
+    def test_webhook_endpoint_without_envelope_metadata(
+        self, mock_dispatcher, mock_validator, mock_config, client, sample_linear_payload, sample_config
+    ):
+        """Test comment events are processed when optional envelope fields are absent."""
+        for key in ("createdAt", "organizationId", "webhookId"):
+            del sample_linear_payload[key]
+        mock_config.find_project_by_id.return_value = sample_config[0]
+        mock_config.agents_by_mention.return_value = {
+            "@developer": sample_config[0]["agents"][0]
+        }
+        mock_validator.validate_signature.return_value = True
+        
+        response = client.post("/webhook/linear", json=sample_linear_payload)
+        
+        assert response.status_code == 200
+        assert response.json()["dispatched"] is True
+        mock_dispatcher.dispatch_agent_task.assert_called_once()
+    
+    def test_webhook_endpoint_invalid_payload_structure(self, client, sample_linear_payload):
+        """Test webhook with valid JSON that is missing required fields."""
+        del sample_linear_payload["data"]
+        
+        with patch('webhook_server.webhook_validator') as mock_validator:
+            mock_validator.validate_signature.return_value = True
+            
+            response = client.post("/webhook/linear", json=sample_linear_payload)
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid webhook payload structure"
 
 
-# Integration test markers
-pytestmark = pytest.mark.integration
\ No newline at end of file
+# Integration test markers. Under `pytest -n auto --dist loadgroup` the module
+# stays on one worker so its module-scoped TestClient and config are built once.
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(name="webhook_integration")]
\ No newline at end of file
@@ -10,14 +10,80 @@ Tests comprehensive Slack configuration functionality including:
 """
 
 import pytest
-import json
+import orjson
+import re
 from pathlib import Path
 from typing import Dict, List, Any
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import patch
 
 from webhook_server import ConfigManager
 
 
+# Slack IDs are a type prefix (C channel, T workspace, U user) plus 10 uppercase alphanumerics
+_SLACK_ID_PATTERNS = {prefix: re.compile(prefix + r"[A-Z0-9]{10}") for prefix in "CTU"}
+
+
+def _is_valid_slack_id(value: Any, prefix: str) -> bool:
+    """Validate an 11-character Slack ID such as C1234567890 with the given type prefix."""
+    return isinstance(value, str) and _SLACK_ID_PATTERNS[prefix].fullmatch(value) is not None
+
+
+def is_valid_slack_channel_id(channel_id: str) -> bool:
+    """Validate Slack channel ID format."""
+    return _is_valid_slack_id(channel_id, "C")
+
+
+def is_valid_slack_workspace_id(workspace_id: str) -> bool:
+    """Validate Slack workspace ID format."""
+    return _is_valid_slack_id(workspace_id, "T")
+
+
+def is_valid_slack_bot_id(bot_id: str) -> bool:
+    """Validate Slack bot ID format."""
+    return _is_valid_slack_id(bot_id, "U")
+
+
+_SLACK_ID_VALIDATORS = {
+    "slackChannelId": is_valid_slack_channel_id,
+    "slackWorkspaceId": is_valid_slack_workspace_id,
+    "slackBotId": is_valid_slack_bot_id,
+}
+
+# Config file contents for the ConfigManager load tests, serialized once at import
+_SLACK_CONFIG_JSON = orjson.dumps([
+    {
+        "linearProjectId": "test-project",
+        "projectName": "Test Project",
+        "repoPath": "/tmp/test",
+        "slackChannelId": "C1234567890",
+        "slackWorkspaceId": "T1234567890",
+        "agents": [
+            {
+                "mention": "@developer",
+                "slackBotId": "U1234567890",
+                "role": "Developer",
+                "testCommand": "pytest"
+            }
+        ]
+    }
+])
+
+_LEGACY_CONFIG_JSON = orjson.dumps([
+    {
+        "linearProjectId": "legacy-project",
+        "projectName": "Legacy Project",
+        "repoPath": "/tmp/legacy",
+        "agents": [
+            {
+                "mention": "@developer",
+                "role": "Developer",
+                "testCommand": "pytest"
+            }
+        ]
+    }
+])
+
+
 class TestSlackConfigValidation:
     """Test Slack configuration validation and parsing."""
     
@@ -93,67 +159,31 @@ class TestSlackConfigValidation:
         assert "slackWorkspaceId" not in legacy_config[0]
         assert "slackBotId" not in legacy_config[0]["agents"][0]
     
-    def test_invalid_slack_channel_id_format(self):
-        """Test validation of invalid Slack channel ID formats."""
-        invalid_channel_ids = [
-            "",  # Empty
-            "C123",  # Too short
-            "D1234567890",  # DM channel (not supported)
-            "G1234567890",  # Group channel
-            "123456789",  # Missing C prefix
-            "c1234567890",  # Lowercase
-            "C12345678901",  # Too long
-        ]
-        
-        for invalid_id in invalid_channel_ids:
-            config = {
-                "linearProjectId": "test-project",
-                "slackChannelId": invalid_id,
-                "agents": []
-            }
-            
-            # In a real implementation, this would validate format
-            # For now, we just test the data structure
-            assert config["slackChannelId"] == invalid_id
-    
-    def test_invalid_slack_workspace_id_format(self):
-        """Test validation of invalid Slack workspace ID formats."""
-        invalid_workspace_ids = [
-            "",  # Empty
-            "T123",  # Too short
-            "123456789",  # Missing T prefix
-            "t1234567890",  # Lowercase
-            "T12345678901",  # Too long
-        ]
-        
-        for invalid_id in invalid_workspace_ids:
-            config = {
-                "linearProjectId": "test-project",
-                "slackWorkspaceId": invalid_id,
-                "agents": []
-            }
-            
-            assert config["slackWorkspaceId"] == invalid_id
-    
-    def test_invalid_slack_bot_id_format(self):
-        """Test validation of invalid Slack bot ID formats."""
-        invalid_bot_ids = [
-            "",  # Empty
-            "U123",  # Too short
-            "123456789",  # Missing U prefix
-            "u1234567890",  # Lowercase
-            "U12345678901",  # Too long
-            "B1234567890",  # Bot user (old format)
-        ]
-        
-        for invalid_id in invalid_bot_ids:
-            agent_config = {
-                "mention": "@developer",
-                "slackBotId": invalid_id,
-                "role": "Developer"
-            }
-            
-            assert agent_config["slackBotId"] == invalid_id
+    @pytest.mark.parametrize("field, invalid_id", [
+        ("slackChannelId", ""),  # Empty
+        ("slackChannelId", "C123"),  # Too short
+        ("slackChannelId", "D1234567890"),  # DM channel (not supported)
+        ("slackChannelId", "G1234567890"),  # Group channel
+        ("slackChannelId", "123456789"),  # Missing C prefix
+        ("slackChannelId", "c1234567890"),  # Lowercase
+        ("slackChannelId", "C12345678901"),  # Too long
+        ("slackWorkspaceId", ""),  # Empty
+        ("slackWorkspaceId", "T123"),  # Too short
+        ("slackWorkspaceId", "123456789"),  # Missing T prefix
+        ("slackWorkspaceId", "t1234567890"),  # Lowercase
+        ("slackWorkspaceId", "T12345678901"),  # Too long
+        ("slackBotId", ""),  # Empty
+        ("slackBotId", "U123"),  # Too short
+        ("slackBotId", "123456789"),  # Missing U prefix
+        ("slackBotId", "u1234567890"),  # Lowercase
+        ("slackBotId", "U12345678901"),  # Too long
+        ("slackBotId", "B1234567890"),  # Bot user (old format)
+    ])
+    def test_invalid_slack_id_format(self, field, invalid_id):
+        """Test validation of invalid Slack channel, workspace and bot ID formats."""
+        validator = _SLACK_ID_VALIDATORS[field]
+        
+        assert validator(invalid_id) is False
     
     def test_multiple_agents_with_slack_ids(self):
         """Test configuration with multiple agents having Slack IDs."""
@@ -236,11 +266,16 @@ class TestSlackConfigMigration:
             }
         ]
         
-        # Simulate migration by adding Slack fields
-        migrated_config = legacy_config.copy()
-        migrated_config[0]["slackChannelId"] = "C1234567890"
-        migrated_config[0]["slackWorkspaceId"] = "T1234567890"
-        migrated_config[0]["agents"][0]["slackBotId"] = "U1234567890"
+        # Simulate migration by adding Slack fields to new dicts, leaving the legacy ones intact
+        migrated_config = [
+            dict(
+                project,
+                slackChannelId="C1234567890",
+                slackWorkspaceId="T1234567890",
+                agents=[dict(agent, slackBotId="U1234567890") for agent in project["agents"]]
+            )
+            for project in legacy_config
+        ]
         
         # Verify migration preserved all original fields
         assert migrated_config[0]["linearProjectId"] == legacy_config[0]["linearProjectId"]
@@ -251,6 +286,11 @@ class TestSlackConfigMigration:
         assert "slackChannelId" in migrated_config[0]
         assert "slackWorkspaceId" in migrated_config[0]
         assert "slackBotId" in migrated_config[0]["agents"][0]
+        
+        # Verify the legacy configuration was not modified
+        assert "slackChannelId" not in legacy_config[0]
+        assert "slackWorkspaceId" not in legacy_config[0]
+        assert "slackBotId" not in legacy_config[0]["agents"][0]
     
     def test_migration_preserves_multiple_projects(self):
         """Test that migration works with multiple project configurations."""
@@ -268,15 +308,22 @@ class TestSlackConfigMigration:
         ]
         
         # Migrate both projects
-        for i, project in enumerate(multi_project_config):
-            project["slackChannelId"] = f"C123456789{i}"
-            project["slackWorkspaceId"] = f"T123456789{i}"
-            for j, agent in enumerate(project["agents"]):
-                agent["slackBotId"] = f"U12345678{i}{j}"
+        migrated_config = [
+            dict(
+                project,
+                slackChannelId=f"C123456789{i}",
+                slackWorkspaceId=f"T123456789{i}",
+                agents=[
+                    dict(agent, slackBotId=f"U12345678{i}{j}")
+                    for j, agent in enumerate(project["agents"])
+                ]
+            )
+            for i, project in enumerate(multi_project_config)
+        ]
         
         # Verify all projects migrated correctly
-        assert len(multi_project_config) == 2
-        for i, project in enumerate(multi_project_config):
+        assert len(migrated_config) == 2
+        for i, project in enumerate(migrated_config):
             assert project["slackChannelId"] == f"C123456789{i}"
             assert project["slackWorkspaceId"] == f"T123456789{i}"
             assert project["agents"][0]["slackBotId"] == f"U12345678{i}0"
@@ -305,37 +352,12 @@ class TestSlackConfigMigration:
 class TestSlackConfigManager:
     """Test ConfigManager with Slack configuration support."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        self.config_manager = ConfigManager()
-    
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    def test_load_config_with_slack_fields(self, mock_exists, mock_file):
+    def test_load_config_with_slack_fields(self, tmp_path):
         """Test loading configuration with Slack fields."""
-        mock_exists.return_value = True
-        
-        slack_config = [
-            {
-                "linearProjectId": "test-project",
-                "projectName": "Test Project",
-                "repoPath": "/tmp/test",
-                "slackChannelId": "C1234567890",
-                "slackWorkspaceId": "T1234567890",
-                "agents": [
-                    {
-                        "mention": "@developer",
-                        "slackBotId": "U1234567890",
-                        "role": "Developer",
-                        "testCommand": "pytest"
-                    }
-                ]
-            }
-        ]
-        
-        mock_file.return_value.read.return_value = json.dumps(slack_config)
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(_SLACK_CONFIG_JSON)
         
-        loaded_config = self.config_manager.load_config()
+        loaded_config = ConfigManager(str(config_file)).load_config()
         
         assert len(loaded_config) == 1
         project = loaded_config[0]
@@ -343,30 +365,12 @@ class TestSlackConfigManager:
         assert project["slackWorkspaceId"] == "T1234567890"
         assert project["agents"][0]["slackBotId"] == "U1234567890"
     
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    def test_load_legacy_config_compatibility(self, mock_exists, mock_file):
+    def test_load_legacy_config_compatibility(self, tmp_path):
         """Test loading legacy configuration without Slack fields."""
-        mock_exists.return_value = True
-        
-        legacy_config = [
-            {
-                "linearProjectId": "legacy-project",
-                "projectName": "Legacy Project",
-                "repoPath": "/tmp/legacy",
-                "agents": [
-                    {
-                        "mention": "@developer",
-                        "role": "Developer",
-                        "testCommand": "pytest"
-                    }
-                ]
-            }
-        ]
-        
-        mock_file.return_value.read.return_value = json.dumps(legacy_config)
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(_LEGACY_CONFIG_JSON)
         
-        loaded_config = self.config_manager.load_config()
+        loaded_config = ConfigManager(str(config_file)).load_config()
         
         assert len(loaded_config) == 1
         project = loaded_config[0]
@@ -378,7 +382,7 @@ class TestSlackConfigManager:
         assert "slackWorkspaceId" not in project
         assert "slackBotId" not in project["agents"][0]
     
-    def test_get_project_by_slack_channel(self):
+    def test_get_project_by_slack_channel(self, tmp_path):
         """Test finding project configuration by Slack channel ID."""
         projects = [
             {
@@ -398,21 +402,20 @@ class TestSlackConfigManager:
             }
         ]
         
-        # Find project by channel ID
-        target_channel = "C2222222222"
-        found_project = None
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(orjson.dumps(projects))
+        config_manager = ConfigManager(str(config_file))
         
-        for project in projects:
-            if project.get("slackChannelId") == target_channel:
-                found_project = project
-                break
+        found_project = config_manager.find_project_by_slack_channel("C2222222222")
         
         assert found_project is not None
         assert found_project["linearProjectId"] == "project-2"
+        assert config_manager.find_project_by_slack_channel("C9999999999") is None
     
-    def test_get_agent_by_slack_bot_id(self):
+    def test_get_agent_by_slack_bot_id(self, tmp_path):
         """Test finding agent configuration by Slack bot ID."""
         project = {
+            "linearProjectId": "project-1",
             "agents": [
                 {
                     "mention": "@developer",
@@ -432,18 +435,19 @@ class TestSlackConfigManager:
             ]
         }
         
-        # Find agent by bot ID
-        target_bot_id = "U2222222222"
-        found_agent = None
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(orjson.dumps([project]))
+        config_manager = ConfigManager(str(config_file))
+        loaded_project = config_manager.find_project_by_id("project-1")
         
-        for agent in project["agents"]:
-            if agent.get("slackBotId") == target_bot_id:
-                found_agent = agent
-                break
-        
-        assert found_agent is not None
-        assert found_agent["mention"] == "@tester"
-        assert found_agent["role"] == "Tester"
+        # Indexed lookup on the loaded project and a scan on an unloaded copy agree
+        for candidate in (loaded_project, project):
+            found_agent = config_manager.find_agent_by_slack_bot_id(candidate, "U2222222222")
+            
+            assert found_agent is not None
+            assert found_agent["mention"] == "@tester"
+            assert found_agent["role"] == "Tester"
+            assert config_manager.find_agent_by_slack_bot_id(candidate, "U9999999999") is None
 
 
 class TestSlackConfigValidationHelpers:
@@ -451,18 +455,6 @@ class TestSlackConfigValidationHelpers:
     
     def test_is_valid_slack_channel_id(self):
         """Test Slack channel ID validation helper."""
-        def is_valid_slack_channel_id(channel_id: str) -> bool:
-            """Validate Slack channel ID format."""
-            if not isinstance(channel_id, str):
-                return False
-            if len(channel_id) != 11:
-                return False
-            if not channel_id.startswith('C'):
-                return False
-            if not channel_id[1:].isalnum():
-                return False
-            return True
-        
         # Valid channel IDs
         assert is_valid_slack_channel_id("C1234567890") is True
         assert is_valid_slack_channel_id("CABCDEFGHIJ") is True
@@ -477,18 +469,6 @@ class TestSlackConfigValidationHelpers:
     
     def test_is_valid_slack_workspace_id(self):
         """Test Slack workspace ID validation helper."""
-        def is_valid_slack_workspace_id(workspace_id: str) -> bool:
-            """Validate Slack workspace ID format."""
-            if not isinstance(workspace_id, str):
-                return False
-            if len(workspace_id) != 11:
-                return False
-            if not workspace_id.startswith('T'):
-                return False
-            if not workspace_id[1:].isalnum():
-                return False
-            return True
-        
         # Valid workspace IDs
         assert is_valid_slack_workspace_id("T1234567890") is True
         assert is_valid_slack_workspace_id("TABCDEFGHIJ") is True
@@ -502,18 +482,6 @@ class TestSlackConfigValidationHelpers:
     
     def test_is_valid_slack_bot_id(self):
         """Test Slack bot ID validation helper."""
-        def is_valid_slack_bot_id(bot_id: str) -> bool:
-            """Validate Slack bot ID format."""
-            if not isinstance(bot_id, str):
-                return False
-            if len(bot_id) != 11:
-                return False
-            if not bot_id.startswith('U'):
-                return False
-            if not bot_id[1:].isalnum():
-                return False
-            return True
-        
         # Valid bot IDs
         assert is_valid_slack_bot_id("U1234567890") is True
         assert is_valid_slack_bot_id("UABCDEFGHIJ") is True
@@ -529,7 +497,7 @@ class TestSlackConfigValidationHelpers:
 class TestSlackConfigEdgeCases:
     """Test edge cases and error conditions in Slack configuration."""
     
-    def test_config_with_duplicate_slack_channel_ids(self):
+    def test_config_with_duplicate_slack_channel_ids(self, tmp_path):
         """Test configuration with duplicate Slack channel IDs."""
         config_with_duplicates = [
             {
@@ -543,17 +511,19 @@ class TestSlackConfigEdgeCases:
                 "agents": []
             }
         ]
-        
-        # Extract all channel IDs
-        channel_ids = [
-            project.get("slackChannelId") 
-            for project in config_with_duplicates
-            if "slackChannelId" in project
-        ]
-        
-        # Should detect duplicates
-        assert len(channel_ids) == 2
-        assert len(set(channel_ids)) == 1  # Only one unique ID
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(orjson.dumps(config_with_duplicates))
+        config_manager = ConfigManager(str(config_file))
+        
+        with patch("webhook_server.logger") as mock_logger:
+            project = config_manager.find_project_by_slack_channel("C1234567890")
+        
+        # The first project keeps the channel and the collision is reported
+        assert project["linearProjectId"] == "project-1"
+        mock_logger.warning.assert_called_once_with(
+            "Slack channel %s is mapped to several projects; using %s",
+            "C1234567890", "project-1"
+        )
     
     def test_config_with_duplicate_slack_bot_ids(self):
         """Test configuration with duplicate Slack bot IDs."""
@@ -570,16 +540,36 @@ class TestSlackConfigEdgeCases:
             ]
         }
         
-        # Extract all bot IDs
-        bot_ids = [
-            agent.get("slackBotId")
-            for agent in config["agents"]
-            if "slackBotId" in agent
-        ]
+        # Several agents may share one bot user; lookups resolve to the first
+        agent = ConfigManager().find_agent_by_slack_bot_id(config, "U1234567890")
         
-        # Should detect duplicates
-        assert len(bot_ids) == 2
-        assert len(set(bot_ids)) == 1  # Only one unique ID
+        assert agent["mention"] == "@developer"
+    
+    def test_duplicate_project_ids_keep_bot_ids_separate(self, tmp_path):
+        """Test bot IDs of a shadowed duplicate project don't resolve on the kept project."""
+        config = [
+            {
+                "linearProjectId": "project-1",
+                "agents": [{"mention": "@developer", "slackBotId": "U1111111111"}]
+            },
+            {
+                "linearProjectId": "project-1",  # Duplicate
+                "agents": [{"mention": "@tester", "slackBotId": "U2222222222"}]
+            }
+        ]
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(orjson.dumps(config))
+        config_manager = ConfigManager(str(config_file))
+        
+        with patch("webhook_server.logger") as mock_logger:
+            project = config_manager.find_project_by_id("project-1")
+        
+        assert config_manager.find_agent_by_slack_bot_id(project, "U1111111111")["mention"] == "@developer"
+        assert config_manager.find_agent_by_slack_bot_id(project, "U2222222222") is None
+        mock_logger.warning.assert_called_once_with(
+            "Linear project %s appears more than once in the config; using the first entry",
+            "project-1"
+        )
     
     def test_empty_slack_configuration(self):
         """Test handling of empty Slack configuration values."""
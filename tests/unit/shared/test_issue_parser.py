@@ -12,15 +12,19 @@ Tests comprehensive Linear issue URL parsing functionality including:
 import pytest
 from typing import Optional, Tuple
 
-from shared.utils.issue_parser import LinearIssueParser
+from shared.utils.issue_parser import (
+    LinearIssueParser,
+    _url_exclusion_pattern,
+    extract_linear_issue,
+    validate_issue_id,
+)
 
 
 class TestLinearIssueParser:
     """Test suite for LinearIssueParser class."""
     
-    def setup_method(self):
-        """Setup test instance."""
-        self.parser = LinearIssueParser()
+    # The parser is stateless, so one instance serves every test in the class
+    parser = LinearIssueParser()
     
     def test_extract_full_linear_url_https(self):
         """Test extracting full Linear URL with HTTPS."""
@@ -200,9 +204,8 @@ class TestLinearIssueParser:
 class TestLinearIssueParserValidation:
     """Test suite for LinearIssueParser validation methods."""
     
-    def setup_method(self):
-        """Setup test instance."""
-        self.parser = LinearIssueParser()
+    # The parser is stateless, so one instance serves every test in the class
+    parser = LinearIssueParser()
     
     def test_validate_issue_id_valid_format(self):
         """Test validation of valid issue ID format."""
@@ -227,6 +230,7 @@ class TestLinearIssueParserValidation:
         assert self.parser.validate_issue_id("AB-12-34") is False # multiple hyphens
         assert self.parser.validate_issue_id("AB_C-123") is False # underscore in prefix
         assert self.parser.validate_issue_id("ABC-") is False     # trailing hyphen
+        assert self.parser.validate_issue_id("ABC-123\n") is False  # trailing newline
     
     def test_validate_issue_id_none_input(self):
         """Test validation with None input."""
@@ -237,9 +241,8 @@ class TestLinearIssueParserValidation:
 class TestLinearIssueParserEdgeCases:
     """Test suite for edge cases and error conditions."""
     
-    def setup_method(self):
-        """Setup test instance."""
-        self.parser = LinearIssueParser()
+    # The parser is stateless, so one instance serves every test in the class
+    parser = LinearIssueParser()
     
     def test_extract_from_none_input(self):
         """Test extraction with None input."""
@@ -310,4 +313,24 @@ class TestLinearIssueParserEdgeCases:
         
         # Should extract just the base URL
         assert issue_id == "ABC-123"
-        assert url == "https://linear.app/team/issue/ABC-123"
\ No newline at end of file
+        assert url == "https://linear.app/team/issue/ABC-123"
+    
+    def test_url_exclusion_pattern_cached_per_issue_id(self):
+        """Test URL-exclusion patterns are compiled once per issue ID."""
+        text = "ABC-123 also at https://example.com/browse/ABC-123"
+        
+        self.parser.extract_linear_issue(text)
+        pattern = _url_exclusion_pattern("ABC-123")
+        self.parser.extract_linear_issue(text)
+        
+        assert _url_exclusion_pattern("ABC-123") is pattern
+        assert pattern.search("https://example.com/browse/ABC-123")
+    
+    def test_module_level_functions_match_parser(self):
+        """Test module-level helpers behave like the parser methods."""
+        text = "Check https://linear.app/team/issue/ABC-123"
+        
+        assert extract_linear_issue(text) == self.parser.extract_linear_issue(text)
+        assert LinearIssueParser.extract_linear_issue(text) == ("ABC-123", "https://linear.app/team/issue/ABC-123")
+        assert validate_issue_id("ABC-123") is True
+        assert validate_issue_id("abc-123") is False
@@ -5,27 +5,36 @@ These tests verify individual components of the agent engine in isolation.
 """
 
 import os
+import subprocess
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 
-# Add src to path for imports
-import sys
-project_root = Path(__file__).parent.parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+from agent_engine import ClaudeAIClient, GitManager, LinearAPIClient
+# Aliased so pytest doesn't try to collect it as a test class
+from agent_engine import TestExecutor as AgentTestExecutor
+
+
+def _linear_response(payload):
+    """Stand-in for the requests.Response returned by a successful Linear API call."""
+    return SimpleNamespace(raise_for_status=lambda: None, content=orjson.dumps(payload))
 
 
 class TestGitManager:
     """Test the Git manager."""
     
+    @pytest.fixture(scope="class")
+    def repo_dir(self, tmp_path_factory):
+        """Working tree shared by the file tests; each test uses its own file name."""
+        return tmp_path_factory.mktemp("repo")
+    
     @patch('agent_engine.git.Repo')
     def test_initialize_repo_success(self, mock_repo_class):
         """Test successful repository initialization."""
-        from agent_engine import GitManager
-        
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
@@ -37,7 +46,6 @@ class TestGitManager:
     @patch('agent_engine.git.Repo')
     def test_initialize_repo_invalid(self, mock_repo_class):
         """Test repository initialization with invalid repo."""
-        from agent_engine import GitManager
         import git
         
         mock_repo_class.side_effect = git.InvalidGitRepositoryError("Invalid repo")
@@ -45,41 +53,35 @@ class TestGitManager:
         with pytest.raises(git.InvalidGitRepositoryError):
             GitManager("/invalid/repo")
     
-    def test_read_file_content_success(self, tmp_path):
+    def test_read_file_content_success(self, repo_dir):
         """Test successful file reading."""
-        from agent_engine import GitManager
-        
         # Create a test file
-        test_file = tmp_path / "test.txt"
+        test_file = repo_dir / "read.txt"
         test_content = "Hello, World!"
         test_file.write_text(test_content)
         
         with patch('agent_engine.git.Repo'):
-            git_manager = GitManager(str(tmp_path))
-            content = git_manager.read_file_content("test.txt")
+            git_manager = GitManager(str(repo_dir))
+            content = git_manager.read_file_content("read.txt")
         
         assert content == test_content
     
-    def test_read_file_content_not_found(self, tmp_path):
+    def test_read_file_content_not_found(self, repo_dir):
         """Test reading non-existent file."""
-        from agent_engine import GitManager
-        
         with patch('agent_engine.git.Repo'):
-            git_manager = GitManager(str(tmp_path))
+            git_manager = GitManager(str(repo_dir))
             content = git_manager.read_file_content("nonexistent.txt")
         
         assert content is None
     
-    def test_write_file_content_success(self, tmp_path):
+    def test_write_file_content_success(self, repo_dir):
         """Test successful file writing."""
-        from agent_engine import GitManager
-        
         with patch('agent_engine.git.Repo'):
-            git_manager = GitManager(str(tmp_path))
-            success = git_manager.write_file_content("test.txt", "Hello, World!")
+            git_manager = GitManager(str(repo_dir))
+            success = git_manager.write_file_content("written.txt", "Hello, World!")
         
         assert success is True
-        assert (tmp_path / "test.txt").read_text() == "Hello, World!"
+        assert (repo_dir / "written.txt").read_text() == "Hello, World!"
 
 
 class TestClaudeAIClient:
@@ -88,8 +90,6 @@ class TestClaudeAIClient:
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
     def test_initialization_success(self):
         """Test successful client initialization."""
-        from agent_engine import ClaudeAIClient
-        
         with patch('agent_engine.Anthropic') as mock_anthropic:
             client = ClaudeAIClient()
             
@@ -98,8 +98,6 @@ class TestClaudeAIClient:
     
     def test_initialization_no_api_key(self):
         """Test initialization without API key."""
-        from agent_engine import ClaudeAIClient
-        
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError, match="Anthropic API key not found"):
                 ClaudeAIClient()
@@ -108,11 +106,8 @@ class TestClaudeAIClient:
     @patch('agent_engine.Anthropic')
     def test_generate_code_success(self, mock_anthropic):
         """Test successful code generation."""
-        from agent_engine import ClaudeAIClient
-        
-        # Mock the response
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Generated code response")]
+        # Stub the response
+        mock_response = SimpleNamespace(content=[SimpleNamespace(text="Generated code response")])
         mock_anthropic.return_value.messages.create.return_value = mock_response
         
         client = ClaudeAIClient()
@@ -126,8 +121,6 @@ class TestClaudeAIClient:
     
     def test_extract_code_blocks_success(self):
         """Test extracting code blocks from response."""
-        from agent_engine import ClaudeAIClient
-        
         response = '''
         ## Analysis
         This is the analysis.
@@ -161,53 +154,55 @@ class TestClaudeAIClient:
 class TestTestExecutor:
     """Test the test executor."""
     
-    def test_run_tests_success(self, tmp_path):
+    @pytest.fixture(autouse=True)
+    def run_outcome(self, monkeypatch):
+        """Stand in for subprocess.run: tests set .result, or .error to raise instead."""
+        outcome = SimpleNamespace(result=None, error=None)
+        
+        def fake_run(*args, **kwargs):
+            if outcome.error is not None:
+                raise outcome.error
+            return outcome.result
+        
+        monkeypatch.setattr('agent_engine.subprocess.run', fake_run)
+        return outcome
+    
+    def test_run_tests_success(self, tmp_path, run_outcome):
         """Test successful test execution."""
-        from agent_engine import TestExecutor
+        executor = AgentTestExecutor(str(tmp_path))
+        run_outcome.result = subprocess.CompletedProcess(
+            args="pytest",
+            returncode=0,
+            stdout="All tests passed",
+            stderr=""
+        )
         
-        executor = TestExecutor(str(tmp_path))
-        
-        with patch('agent_engine.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="All tests passed",
-                stderr=""
-            )
-            
-            success, output = executor.run_tests("pytest")
+        success, output = executor.run_tests("pytest")
         
         assert success is True
         assert "All tests passed" in output
     
-    def test_run_tests_failure(self, tmp_path):
+    def test_run_tests_failure(self, tmp_path, run_outcome):
         """Test failed test execution."""
-        from agent_engine import TestExecutor
-        
-        executor = TestExecutor(str(tmp_path))
+        executor = AgentTestExecutor(str(tmp_path))
+        run_outcome.result = subprocess.CompletedProcess(
+            args="pytest",
+            returncode=1,
+            stdout="",
+            stderr="Test failed"
+        )
         
-        with patch('agent_engine.subprocess.run') as mock_run:
-            mock_run.return_value = Mock(
-                returncode=1,
-                stdout="",
-                stderr="Test failed"
-            )
-            
-            success, output = executor.run_tests("pytest")
+        success, output = executor.run_tests("pytest")
         
         assert success is False
         assert "Test failed" in output
     
-    def test_run_tests_timeout(self, tmp_path):
+    def test_run_tests_timeout(self, tmp_path, run_outcome):
         """Test test execution timeout."""
-        from agent_engine import TestExecutor
-        import subprocess
+        executor = AgentTestExecutor(str(tmp_path))
+        run_outcome.error = subprocess.TimeoutExpired("pytest", 300)
         
-        executor = TestExecutor(str(tmp_path))
-        
-        with patch('agent_engine.subprocess.run') as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("pytest", 300)
-            
-            success, output = executor.run_tests("pytest")
+        success, output = executor.run_tests("pytest")
         
         assert success is False
         assert "timed out" in output
@@ -219,59 +214,52 @@ class TestLinearAPIClient:
     @patch.dict(os.environ, {"LINEAR_API_KEY": "test-key"})
     def test_initialization_success(self):
         """Test successful client initialization."""
-        from agent_engine import LinearAPIClient
-        
         client = LinearAPIClient()
         assert client.api_key == "test-key"
     
     def test_initialization_no_api_key(self):
         """Test initialization without API key."""
-        from agent_engine import LinearAPIClient
-        
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError, match="Linear API key not found"):
                 LinearAPIClient()
     
     @patch.dict(os.environ, {"LINEAR_API_KEY": "test-key"})
-    @patch('agent_engine.requests.post')
+    @patch('agent_engine.requests.Session.post')
     def test_add_comment_success(self, mock_post):
         """Test successful comment addition."""
-        from agent_engine import LinearAPIClient
-        
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Stub successful response
+        mock_post.return_value = _linear_response({
             "data": {
                 "commentCreate": {
                     "success": True,
                     "comment": {"id": "comment-123"}
                 }
             }
-        }
-        mock_post.return_value = mock_response
+        })
         
         client = LinearAPIClient()
         result = client.add_comment("issue-123", "Test comment")
         
         assert result is True
         mock_post.assert_called_once()
+        assert orjson.loads(mock_post.call_args.kwargs["data"])["variables"] == {
+            "issueId": "issue-123",
+            "body": "Test comment"
+        }
+        assert client.session.headers["Authorization"] == "Bearer test-key"
     
     @patch.dict(os.environ, {"LINEAR_API_KEY": "test-key"})
-    @patch('agent_engine.requests.post')
+    @patch('agent_engine.requests.Session.post')
     def test_add_comment_failure(self, mock_post):
         """Test failed comment addition."""
-        from agent_engine import LinearAPIClient
-        
-        # Mock failed response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Stub failed response
+        mock_post.return_value = _linear_response({
             "data": {
                 "commentCreate": {
                     "success": False
                 }
             }
-        }
-        mock_post.return_value = mock_response
+        })
         
         client = LinearAPIClient()
         result = client.add_comment("issue-123", "Test comment")